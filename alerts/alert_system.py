@@ -4,30 +4,230 @@ Provides visual and audio warnings.
 """
 
 import time
-import pygame
+import queue
+import threading
+from collections import OrderedDict
+from functools import lru_cache, partial
 import cv2
 import numpy as np
-from pathlib import Path
 from config.settings import Config
 from utils.logger import log
 
 
+# Requested mixer format: mono with a small buffer for low alert latency
+SAMPLE_RATE = 22050
+MIXER_CHANNELS = 1
+MIXER_BUFFER = 256
+MIXER_NUM_CHANNELS = 2  # Beep + alarm
+ALARM_DURATION = 0.8  # Longer duration for alarm
+
+# Alert levels that produce an audible beep
+_ALERTING_LEVELS = frozenset(("WARNING", "DANGER"))
+
+
+def _expand_channels(wave, channels):
+    """
+    Lay out a mono waveform for the mixer's channel count.
+    
+    Args:
+        wave (np.ndarray): (N,) int16 mono samples
+        channels (int): Number of mixer output channels
+    
+    Returns:
+        np.ndarray: The mono buffer itself, or an (N, channels) copy; either
+            way C-contiguous, i.e. already in the mixer's interleaved layout
+    """
+    if channels == 1:
+        return wave
+    
+    # One allocation, one copy of the mono data
+    return np.broadcast_to(wave[:, None], (wave.shape[0], channels)).copy()
+
+
+def _decay_envelope(n, rate, sample_rate):
+    """
+    Build the exponential decay envelope exp(-rate * t).
+    
+    The samples are evenly spaced, so the envelope is a geometric series
+    and a single cumulative product replaces evaluating exp per sample.
+    
+    Args:
+        n (int): Number of samples
+        rate (float): Decay rate per second
+        sample_rate (int): Samples per second
+    
+    Returns:
+        np.ndarray: (n,) float32 envelope starting at 1.0
+    """
+    envelope = np.empty(n, dtype=np.float32)
+    envelope[:1] = 1.0
+    envelope[1:] = np.exp(-rate / sample_rate)
+    np.cumprod(envelope, out=envelope)
+    return envelope
+
+
+@lru_cache(maxsize=None)
+def _build_beep(sample_rate, duration, frequency, channels):
+    """
+    Build the 16-bit beep waveform.
+    
+    Cached per parameter set, so the synthesis runs once per process.
+    
+    Args:
+        sample_rate (int): Samples per second
+        duration (float): Beep length in seconds
+        frequency (float): Tone frequency in Hz
+        channels (int): Number of mixer output channels
+    
+    Returns:
+        np.ndarray: (N,) int16 samples for mono, (N, channels) otherwise
+    """
+    # Generate sine wave in place. The phase reaches thousands of radians,
+    # so it is kept in float64 and only the sine is narrowed to float32
+    n = int(sample_rate * duration)
+    phase = np.arange(n, dtype=np.float64)
+    phase *= 2 * np.pi * frequency / sample_rate
+    np.sin(phase, out=phase)
+    wave = phase.astype(np.float32)
+    
+    # Apply envelope to avoid clicks
+    wave *= _decay_envelope(n, 3.0, sample_rate)  # Less decay for louder sound
+    
+    # Convert to 16-bit PCM
+    wave *= 32767
+    wave = wave.astype(np.int16)
+    
+    return _expand_channels(wave, channels)
+
+
+@lru_cache(maxsize=None)
+def _build_alarm(sample_rate, duration, channels):
+    """
+    Build the 16-bit siren waveform used for the continuous alarm.
+    
+    Args:
+        sample_rate (int): Samples per second
+        duration (float): Alarm loop length in seconds
+        channels (int): Number of mixer output channels
+    
+    Returns:
+        np.ndarray: (N,) int16 samples for mono, (N, channels) otherwise
+    """
+    # Create alternating high-low frequency alarm
+    n = int(sample_rate * duration)
+    t = np.arange(n, dtype=np.float64)
+    t *= 1.0 / sample_rate
+    
+    # Oscillate between two frequencies for siren effect (3 Hz oscillation),
+    # folded into the phase buffer so no per-step temporaries are created.
+    # The phase reaches thousands of radians, so it is kept in float64 and
+    # only the sine is narrowed to float32
+    freq1 = 1200  # High frequency
+    freq2 = 800   # Low frequency
+    phase = np.multiply(t, 2 * np.pi * 3)
+    np.sin(phase, out=phase)
+    phase += 1
+    phase *= (freq2 - freq1) / 2
+    phase += freq1
+    phase *= t
+    phase *= 2 * np.pi
+    np.sin(phase, out=phase)
+    wave = phase.astype(np.float32)
+    
+    # Less envelope decay for sustained sound
+    wave *= _decay_envelope(n, 1.0, sample_rate)
+    
+    # Convert to 16-bit PCM
+    wave *= 32767
+    wave = wave.astype(np.int16)
+    
+    return _expand_channels(wave, channels)
+
+
+@lru_cache(maxsize=16)
+def _text_layout(message, font_scale, width, banner_height):
+    """
+    Compute the centered banner text position.
+    
+    Banner messages come from a small fixed set, so the text metrics are
+    memoized instead of being measured on every frame.
+    
+    Args:
+        message (str): Banner text
+        font_scale (float): Font scale
+        width (int): Frame width
+        banner_height (int): Banner height in pixels
+    
+    Returns:
+        tuple: (text_x, text_y) baseline origin of the text
+    """
+    text_size = cv2.getTextSize(message, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 2)[0]
+    text_x = (width - text_size[0]) // 2
+    text_y = banner_height // 2 + text_size[1] // 2
+    return text_x, text_y
+
+
+@lru_cache(maxsize=16)
+def _solid_block(color, height, width):
+    """
+    Return a cached solid-color BGR block used for banner blending.
+    
+    Args:
+        color (tuple): BGR color
+        height (int): Block height
+        width (int): Block width
+    
+    Returns:
+        np.ndarray: (height, width, 3) uint8 block (shared, do not modify)
+    """
+    return np.full((height, width, 3), color, dtype=np.uint8)
+
+
 class AlertSystem:
     """Manage visual and audio alerts for drowsiness detection."""
     
+    # Drowsiness score bar layout
+    SCORE_BAR_WIDTH = 125
+    SCORE_BAR_HEIGHT = 20
+    SCORE_BAR_Y = 200
+    SCORE_BAR_MARGIN = 20     # Gap between bar and right frame edge
+    SCORE_LABEL_HEIGHT = 20   # Rows above the bar reserved for its label
+    
+    # Status indicator panel layout
+    STATUS_PANEL_WIDTH = 220
+    STATUS_PANEL_HEIGHT = 100
+    STATUS_PANEL_TOP = 20     # Rows above the first baseline
+    STATUS_PANEL_LEFT = 2     # Columns of slack left of the text origin
+    
+    # Maximum number of cached text/HUD sprites
+    SPRITE_CACHE_SIZE = 32
+    
     def __init__(self):
         """Initialize alert system."""
-        self.last_audio_alert_time = 0
+        # Timestamps are integer milliseconds on the monotonic clock
+        self.last_audio_alert_ms = 0
+        self._cooldown_ms = int(Config.AUDIO_ALERT_COOLDOWN * 1000)
+        self._continuous_alarm_enabled = Config.CONTINUOUS_ALARM_ENABLED
+        self._continuous_alarm_threshold = Config.CONTINUOUS_ALARM_THRESHOLD
+        self._phone_alert_score = Config.DROWSINESS_SCORE_MAX  # Phone usage counts as maximum drowsiness
         self.audio_initialized = False
         
         # FIX #4: Continuous alarm state
         self.continuous_alarm_active = False
-        self.alarm_start_time = 0
+        self.alarm_start_ms = 0
         
-        # Initialize pygame mixer for audio
+        # Initialize pygame mixer for audio (pygame is only imported when
+        # audio is enabled, it is slow to load)
+        self._pygame = None
         if Config.ENABLE_AUDIO_ALERTS:
             try:
+                import pygame
+                self._pygame = pygame
+                
+                # Small mono buffer: ~12 ms of latency instead of ~185 ms
+                pygame.mixer.pre_init(frequency=SAMPLE_RATE, size=-16, channels=MIXER_CHANNELS, buffer=MIXER_BUFFER)
                 pygame.mixer.init()
+                pygame.mixer.set_num_channels(MIXER_NUM_CHANNELS)
                 self.audio_initialized = True
                 log.info("Audio alert system initialized")
             except Exception as e:
@@ -40,31 +240,264 @@ class AlertSystem:
         if self.audio_initialized:
             self._create_beep_sound()
             self._create_alarm_sound()
+        
+        # Sounds are played by a background worker so mixer calls never
+        # stall the video loop; one pending sound at most
+        self._audio_queue = queue.Queue(maxsize=1)
+        self._audio_thread = None
+        if self.audio_initialized:
+            self._audio_thread = threading.Thread(target=self._audio_loop, name="AudioAlerts", daemon=True)
+            self._audio_thread.start()
+        
+        # Rendered overlay sprites keyed on the state they depict
+        self._sprite_cache = OrderedDict()
+        
+        # Config values used on every frame, read once
+        self._color_normal = Config.COLOR_NORMAL
+        self._color_warning = Config.COLOR_WARNING
+        self._color_danger = Config.COLOR_DANGER
+        self._normal_banner_color = Config.NORMAL_BANNER_COLOR
+        self._show_normal_banner = Config.SHOW_NORMAL_BANNER
+        
+        # Score bar fill width and color per integer score
+        self._score_lut_max = int(Config.DROWSINESS_SCORE_MAX)
+        self._score_fill_lut, self._score_color_lut = self._build_score_luts()
+        
+        # HUD layout, recomputed only when the frame shape changes
+        self._cached_shape = None
+        self._frame_width = 0
+        self._bar_x = 0
+        self._bar_y = 0
+        self._status_x = 0
+        self._status_text_x = self.STATUS_PANEL_LEFT
+        self._status_y = 0
+        self._status_height = self.STATUS_PANEL_HEIGHT
+        
+        # Last rendered status panel and the texts it shows
+        self._status_key = None
+        self._status_sprite = None
+    
+    def _build_score_luts(self):
+        """
+        Tabulate score bar fill width and color for every integer score.
+        
+        Returns:
+            tuple: (fill_widths, colors) lists indexed by score
+        """
+        fill_widths = []
+        colors = []
+        for score in range(self._score_lut_max + 1):
+            # Fill based on score
+            fill_widths.append(int((score / Config.DROWSINESS_SCORE_MAX) * self.SCORE_BAR_WIDTH))
+            
+            # Color based on level
+            if score >= Config.ALERT_LEVEL_DANGER:
+                colors.append(Config.COLOR_DANGER)
+            elif score >= Config.ALERT_LEVEL_WARNING:
+                colors.append(Config.COLOR_WARNING)
+            else:
+                colors.append(Config.COLOR_NORMAL)
+        
+        return fill_widths, colors
+    
+    def _precompute_layout(self, height, width):
+        """
+        Compute HUD positions for a frame size.
+        
+        Args:
+            height (int): Frame height
+            width (int): Frame width
+        """
+        self._frame_width = width
+        
+        # Score bar (sprite origin: one column left of the bar, label rows above)
+        self._bar_x = width - self.SCORE_BAR_WIDTH - self.SCORE_BAR_MARGIN - 1
+        self._bar_y = self.SCORE_BAR_Y - self.SCORE_LABEL_HEIGHT
+        
+        # Status indicators (panel origin: slack left of and above the text).
+        # On frames too small for the panel it is cut to the frame: it starts
+        # at column 0 with the text moved left within it, and stops at the
+        # last row, so putText clips the text at the same edges the frame has
+        status_x = width - 220 - self.STATUS_PANEL_LEFT
+        self._status_x = max(status_x, 0)
+        self._status_text_x = status_x - self._status_x + self.STATUS_PANEL_LEFT
+        self._status_y = 80 - self.STATUS_PANEL_TOP
+        self._status_height = max(1, min(self.STATUS_PANEL_HEIGHT, height - self._status_y))
+        self._status_key = None
+    
+    def _get_sprite(self, key, render):
+        """
+        Fetch a rendered overlay sprite, rendering it on a cache miss.
+        
+        Args:
+            key (tuple): State the sprite depicts
+            render (callable): Returns (image, mask) for the sprite
+        
+        Returns:
+            tuple: (image, mask) sprite
+        """
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            sprite = render()
+            self._sprite_cache[key] = sprite
+            if len(self._sprite_cache) > self.SPRITE_CACHE_SIZE:
+                self._sprite_cache.popitem(last=False)
+        else:
+            self._sprite_cache.move_to_end(key)
+        return sprite
+    
+    @staticmethod
+    def _blit_sprite(frame, sprite, x, y):
+        """
+        Copy the masked pixels of a sprite onto the frame.
+        
+        Args:
+            frame (np.ndarray): Target frame
+            sprite (tuple): (image, mask) sprite
+            x (int): Left edge in frame coordinates
+            y (int): Top edge in frame coordinates
+        """
+        image, mask = sprite
+        h, w = image.shape[:2]
+        
+        # Clip to the frame on all sides, as putText does; a negative slice
+        # start would wrap around to the opposite edge instead
+        x1 = max(x, 0)
+        y1 = max(y, 0)
+        x2 = min(x + w, frame.shape[1])
+        y2 = min(y + h, frame.shape[0])
+        if x2 <= x1 or y2 <= y1:
+            return
+        
+        sy = slice(y1 - y, y2 - y)
+        sx = slice(x1 - x, x2 - x)
+        np.copyto(frame[y1:y2, x1:x2], image[sy, sx], where=mask[sy, sx])
+    
+    def _render_banner_text(self, message, font_scale, width, banner_height):
+        """
+        Render outlined banner text into a sprite.
+        
+        Args:
+            message (str): Banner text
+            font_scale (float): Font scale
+            width (int): Frame width
+            banner_height (int): Banner height in pixels
+        
+        Returns:
+            tuple: (image, mask) sprite covering the banner
+        """
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        text_x, text_y = _text_layout(message, font_scale, width, banner_height)
+        
+        image = np.zeros((banner_height, width, 3), dtype=np.uint8)
+        mask = np.zeros((banner_height, width), dtype=np.uint8)
+        
+        # Text with outline for better visibility
+        cv2.putText(image, message, (text_x, text_y), font, font_scale, (0, 0, 0), 4)
+        cv2.putText(mask, message, (text_x, text_y), font, font_scale, 255, 4)
+        cv2.putText(image, message, (text_x, text_y), font, font_scale, (255, 255, 255), 2)
+        
+        return image, mask.astype(bool)[:, :, None]
+    
+    def _render_score_bar(self, fill_width, color, label):
+        """
+        Render the score bar with its fill and label into a sprite.
+        
+        Args:
+            fill_width (int): Filled part of the bar in pixels
+            color (tuple): Fill color
+            label (str): Text drawn above the bar
+        
+        Returns:
+            tuple: (image, mask) sprite, label rows first and starting one
+                column left of the bar
+        """
+        bar_width = self.SCORE_BAR_WIDTH
+        bar_height = self.SCORE_BAR_HEIGHT
+        
+        # Bar origin inside the sprite: one column of slack for the border
+        # stroke, label rows above
+        x = 1
+        y = self.SCORE_LABEL_HEIGHT
+        
+        image = np.zeros((y + bar_height + 2, x + bar_width + self.SCORE_BAR_MARGIN, 3), dtype=np.uint8)
+        mask = np.zeros(image.shape[:2], dtype=np.uint8)
+        
+        # Background
+        cv2.rectangle(image, (x, y), (x + bar_width, y + bar_height), (50, 50, 50), -1)
+        cv2.rectangle(image, (x, y), (x + bar_width, y + bar_height), (255, 255, 255), 2)
+        cv2.rectangle(mask, (x, y), (x + bar_width, y + bar_height), 255, -1)
+        cv2.rectangle(mask, (x, y), (x + bar_width, y + bar_height), 255, 2)
+        
+        # Fill
+        if fill_width > 0:
+            cv2.rectangle(image, (x, y), (x + fill_width, y + bar_height), color, -1)
+        
+        # Label
+        cv2.putText(image, label, (x, y - 5), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        cv2.putText(mask, label, (x, y - 5), cv2.FONT_HERSHEY_SIMPLEX, 0.5, 255, 1)
+        
+        return image, mask.astype(bool)[:, :, None]
+    
+    def _render_status_panel(self, face_detected, eyes_closed, yawning, ear_text, mar_text):
+        """
+        Render the eye/mouth status and EAR/MAR readouts into one sprite.
+        
+        Args:
+            face_detected (bool): Whether a face is detected
+            eyes_closed (bool): Prolonged eye closure flag
+            yawning (bool): Yawn flag
+            ear_text (str): Formatted EAR readout
+            mar_text (str): Formatted MAR readout
+        
+        Returns:
+            tuple: (image, mask) sprite with the first baseline
+                STATUS_PANEL_TOP rows down
+        """
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        x = self._status_text_x
+        y = self.STATUS_PANEL_TOP
+        
+        image = np.zeros((self._status_height, x + self.STATUS_PANEL_WIDTH, 3), dtype=np.uint8)
+        mask = np.zeros(image.shape[:2], dtype=np.uint8)
+        
+        # FIX #1: Only show status if face is detected
+        if not face_detected:
+            # Show "No Face Detected" message
+            lines = [("No Face Detected", 0, 0.5, (0, 0, 255), 2)]
+        else:
+            # Eyes status
+            eye_status = "CLOSED" if eyes_closed else "OPEN"
+            eye_color = self._color_danger if eyes_closed else self._color_normal
+            
+            # Yawn status
+            yawn_status = "YAWNING" if yawning else "NORMAL"
+            yawn_color = self._color_warning if yawning else self._color_normal
+            
+            lines = [
+                (f"Eyes: {eye_status}", 0, 0.5, eye_color, 2),
+                (f"Mouth: {yawn_status}", 25, 0.5, yawn_color, 2),
+                (ear_text, 50, 0.4, (255, 255, 255), 1),
+                (mar_text, 70, 0.4, (255, 255, 255), 1)
+            ]
+        
+        for text, dy, scale, color, thickness in lines:
+            cv2.putText(image, text, (x, y + dy), font, scale, color, thickness)
+            cv2.putText(mask, text, (x, y + dy), font, scale, 255, thickness)
+        
+        return image, mask.astype(bool)[:, :, None]
     
     def _create_beep_sound(self):
         """Create a simple beep sound programmatically."""
         try:
             # FIX #4: Louder, more urgent beep
-            sample_rate = 22050
-            duration = Config.BEEP_DURATION
-            frequency = Config.BEEP_FREQUENCY
-            
-            # Generate sine wave
-            t = np.linspace(0, duration, int(sample_rate * duration))
-            wave = np.sin(2 * np.pi * frequency * t)
-            
-            # Apply envelope to avoid clicks
-            envelope = np.exp(-3 * t)  # Less decay for louder sound
-            wave = wave * envelope
+            # The device may not honour the requested format, so build for
+            # what the mixer actually opened with
+            sample_rate, _, channels = self._pygame.mixer.get_init()
+            wave = _build_beep(sample_rate, Config.BEEP_DURATION, Config.BEEP_FREQUENCY, channels)
             
-            # Convert to 16-bit PCM
-            wave = (wave * 32767).astype(np.int16)
-            
-            # Create stereo sound
-            stereo_wave = np.column_stack([wave, wave])
-            
-            # Create pygame sound
-            self.beep_sound = pygame.sndarray.make_sound(stereo_wave)
+            # Create pygame sound straight from the interleaved int16 buffer
+            self.beep_sound = self._pygame.mixer.Sound(buffer=wave)
             self.beep_sound.set_volume(Config.AUDIO_VOLUME)
             
             log.info("Beep sound created successfully")
@@ -75,32 +508,11 @@ class AlertSystem:
     def _create_alarm_sound(self):
         """Create a continuous alarm sound (FIX #4)."""
         try:
-            sample_rate = 22050
-            duration = 0.8  # Longer duration for alarm
-            
-            # Create alternating high-low frequency alarm
-            t = np.linspace(0, duration, int(sample_rate * duration))
-            
-            # Oscillate between two frequencies for siren effect
-            freq1 = 1200  # High frequency
-            freq2 = 800   # Low frequency
-            oscillation = np.sin(2 * np.pi * 3 * t)  # 3 Hz oscillation
-            frequency = freq1 + (freq2 - freq1) * (oscillation + 1) / 2
-            
-            wave = np.sin(2 * np.pi * frequency * t)
-            
-            # Less envelope decay for sustained sound
-            envelope = np.exp(-1 * t)
-            wave = wave * envelope
-            
-            # Convert to 16-bit PCM
-            wave = (wave * 32767).astype(np.int16)
-            
-            # Create stereo sound
-            stereo_wave = np.column_stack([wave, wave])
+            sample_rate, _, channels = self._pygame.mixer.get_init()
+            wave = _build_alarm(sample_rate, ALARM_DURATION, channels)
             
-            # Create pygame sound
-            self.alarm_sound = pygame.sndarray.make_sound(stereo_wave)
+            # Create pygame sound straight from the interleaved int16 buffer
+            self.alarm_sound = self._pygame.mixer.Sound(buffer=wave)
             self.alarm_sound.set_volume(Config.AUDIO_VOLUME)
             
             log.info("Alarm sound created successfully")
@@ -108,6 +520,33 @@ class AlertSystem:
             log.warning(f"Could not create alarm sound: {e}")
             self.alarm_sound = None
     
+    def _audio_loop(self):
+        """Run queued mixer commands until the shutdown sentinel (None) arrives."""
+        while True:
+            command = self._audio_queue.get()
+            if command is None:
+                break
+            try:
+                command()
+            except Exception as e:
+                log.error(f"Error playing alert: {e}")
+    
+    def _queue_audio(self, command):
+        """
+        Hand a mixer command to the audio worker without blocking.
+        
+        Args:
+            command (callable): Zero-argument call such as Sound.play
+        
+        Returns:
+            bool: True if queued, False if a command is already pending
+        """
+        try:
+            self._audio_queue.put_nowait(command)
+            return True
+        except queue.Full:
+            return False
+    
     def play_alert(self, alert_level, drowsiness_score):
         """
         Play audio alert based on alert level.
@@ -119,49 +558,41 @@ class AlertSystem:
         if not self.audio_initialized:
             return
         
-        current_time = time.time()
+        current_ms = time.monotonic_ns() // 1_000_000
         
         # FIX #4: Continuous alarm for high drowsiness
-        if Config.CONTINUOUS_ALARM_ENABLED and drowsiness_score >= Config.CONTINUOUS_ALARM_THRESHOLD:
+        if self._continuous_alarm_enabled and drowsiness_score >= self._continuous_alarm_threshold:
             if not self.continuous_alarm_active:
-                self.continuous_alarm_active = True
-                self.alarm_start_time = current_time
-                log.error("CONTINUOUS ALARM ACTIVATED!")
-            
-            # Play alarm sound repeatedly
-            if self.alarm_sound and (current_time - self.last_audio_alert_time) >= 0.5:
-                try:
-                    self.alarm_sound.play()
-                    self.last_audio_alert_time = current_time
-                except Exception as e:
-                    log.error(f"Error playing alarm: {e}")
+                # The mixer loops the alarm itself until it is stopped, so
+                # playback does not depend on the frame rate. If the worker
+                # is busy, activation is retried on the next frame.
+                if self.alarm_sound is None or self._queue_audio(partial(self.alarm_sound.play, loops=-1)):
+                    self.continuous_alarm_active = True
+                    self.alarm_start_ms = current_ms
+                    self.last_audio_alert_ms = current_ms
+                    log.error("CONTINUOUS ALARM ACTIVATED!")
         
         else:
-            # Deactivate continuous alarm
+            # Deactivate continuous alarm (retried next frame if the worker is busy)
             if self.continuous_alarm_active:
-                self.continuous_alarm_active = False
-                log.info("Continuous alarm deactivated")
+                if self.alarm_sound is None or self._queue_audio(self.alarm_sound.stop):
+                    self.continuous_alarm_active = False
+                    log.info("Continuous alarm deactivated")
             
             # Regular beep alerts
             # Check cooldown
-            if current_time - self.last_audio_alert_time < Config.AUDIO_ALERT_COOLDOWN:
+            if current_ms - self.last_audio_alert_ms < self._cooldown_ms:
                 return
             
             if alert_level == "DANGER" and self.beep_sound:
-                try:
-                    self.beep_sound.play()
-                    self.last_audio_alert_time = current_time
+                if self._queue_audio(self.beep_sound.play):
+                    self.last_audio_alert_ms = current_ms
                     log.warning("DANGER alert played")
-                except Exception as e:
-                    log.error(f"Error playing alert: {e}")
             
             elif alert_level == "WARNING" and self.beep_sound:
-                try:
-                    self.beep_sound.play()
-                    self.last_audio_alert_time = current_time
+                if self._queue_audio(self.beep_sound.play):
+                    self.last_audio_alert_ms = current_ms
                     log.info("WARNING alert played")
-                except Exception as e:
-                    log.error(f"Error playing alert: {e}")
     
     def draw_alert_overlay(self, frame, drowsiness_data):
         """
@@ -174,61 +605,70 @@ class AlertSystem:
         Returns:
             np.ndarray: Frame with alert overlay
         """
+        # Read everything the overlay needs from the result dict once
         alert_level = drowsiness_data['alert_level']
         drowsiness_score = drowsiness_data['drowsiness_score']
         face_detected = drowsiness_data.get('face_detected', True)
-        
-        # Get frame dimensions
-        height, width = frame.shape[:2]
+        status = (
+            face_detected,
+            drowsiness_data['eyes_closed'],
+            drowsiness_data['yawning'],
+            drowsiness_data['ear'],
+            drowsiness_data['mar']
+        )
+        
+        # Layout depends only on the frame size, which is normally fixed
+        if frame.shape != self._cached_shape:
+            self._cached_shape = frame.shape
+            self._precompute_layout(*frame.shape[:2])
+        width = self._frame_width
         
         # FIX #5: Always show banner - green when normal, red/orange when drowsy
         if alert_level == "DANGER":
-            color = Config.COLOR_DANGER
+            color = self._color_danger
             message = "!!! DROWSINESS ALERT! TAKE A BREAK !!!"
             banner_height = 80
         elif alert_level == "WARNING":
-            color = Config.COLOR_WARNING
+            color = self._color_warning
             message = "! Warning: Stay Alert !"
             banner_height = 60
         else:  # NORMAL
             # FIX #5: Show green "ALERT" banner when normal
-            if Config.SHOW_NORMAL_BANNER and face_detected:
-                color = Config.NORMAL_BANNER_COLOR
+            if self._show_normal_banner and face_detected:
+                color = self._normal_banner_color
                 message = "ALERT - Driver Monitoring Active"
                 banner_height = 50
             else:
                 # Don't draw banner if no face detected
                 if face_detected:
-                    color = Config.COLOR_NORMAL
+                    color = self._color_normal
                     message = "Status: Normal"
                     banner_height = 50
                 else:
                     # Skip banner drawing when no face
                     self._draw_score_bar(frame, drowsiness_score)
-                    self._draw_status_indicators(frame, drowsiness_data)
+                    self._draw_status_indicators(frame, *status)
                     return frame
         
-        # Draw semi-transparent banner
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (width, banner_height), color, -1)
-        cv2.addWeighted(overlay, 0.6, frame, 0.4, 0, frame)
+        # Draw semi-transparent banner (blend only the banner rows in place;
+        # the rows are inclusive of banner_height, as with cv2.rectangle)
+        roi = frame[:banner_height + 1]
+        solid = _solid_block(color, roi.shape[0], width)
+        cv2.addWeighted(solid, 0.6, roi, 0.4, 0, dst=roi)
         
-        # Draw message
-        font = cv2.FONT_HERSHEY_SIMPLEX
+        # Draw message (rendered once per message and frame width)
         font_scale = 1.0 if alert_level == "DANGER" else 0.7
-        text_size = cv2.getTextSize(message, font, font_scale, 2)[0]
-        text_x = (width - text_size[0]) // 2
-        text_y = banner_height // 2 + text_size[1] // 2
-        
-        # Draw text with outline for better visibility
-        cv2.putText(frame, message, (text_x, text_y), font, font_scale, (0, 0, 0), 4)
-        cv2.putText(frame, message, (text_x, text_y), font, font_scale, (255, 255, 255), 2)
+        sprite = self._get_sprite(
+            ('banner', message, font_scale, width, banner_height),
+            lambda: self._render_banner_text(message, font_scale, width, banner_height)
+        )
+        self._blit_sprite(frame, sprite, 0, 0)
         
         # Draw drowsiness score bar
         self._draw_score_bar(frame, drowsiness_score)
         
         # Draw status indicators
-        self._draw_status_indicators(frame, drowsiness_data)
+        self._draw_status_indicators(frame, *status)
         
         return frame
     
@@ -240,96 +680,101 @@ class AlertSystem:
             frame (np.ndarray): Input frame
             score (float): Drowsiness score (0-100)
         """
-        height, width = frame.shape[:2]
-        
-        # Bar dimensions
-        bar_width = 125
-        bar_height = 20
-        bar_x = width - bar_width - 20
-        bar_y = 200
-        
-        # Background
-        cv2.rectangle(frame, (bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height), (50, 50, 50), -1)
-        cv2.rectangle(frame, (bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height), (255, 255, 255), 2)
-        
-        # Fill based on score
-        fill_width = int((score / Config.DROWSINESS_SCORE_MAX) * bar_width)
-        
-        # Color based on level
-        if score >= Config.ALERT_LEVEL_DANGER:
-            color = Config.COLOR_DANGER
-        elif score >= Config.ALERT_LEVEL_WARNING:
-            color = Config.COLOR_WARNING
-        else:
-            color = Config.COLOR_NORMAL
-        
-        if fill_width > 0:
-            cv2.rectangle(frame, (bar_x, bar_y), (bar_x + fill_width, bar_y + bar_height), color, -1)
-        
-        # Label
-        label = f"Drowsiness: {int(score)}%"
-        cv2.putText(frame, label, (bar_x, bar_y - 5), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        # Fill width and color come from tables indexed by the integer score
+        percent = min(self._score_lut_max, max(0, int(score)))
+        fill_width = self._score_fill_lut[percent]
+        color = self._score_color_lut[percent]
+        
+        # Bar, fill and label are re-rendered only when what they show changes
+        sprite = self._get_sprite(
+            ('score', percent),
+            lambda: self._render_score_bar(fill_width, color, f"Drowsiness: {percent}%")
+        )
+        self._blit_sprite(frame, sprite, self._bar_x, self._bar_y)
     
-    def _draw_status_indicators(self, frame, drowsiness_data):
+    def _draw_status_indicators(self, frame, face_detected, eyes_closed, yawning, ear, mar):
         """
         Draw status indicators for eyes and mouth.
         
         Args:
             frame (np.ndarray): Input frame
-            drowsiness_data (dict): Drowsiness detection results
+            face_detected (bool): Whether a face is detected
+            eyes_closed (bool): Prolonged eye closure flag
+            yawning (bool): Yawn flag
+            ear (float): Eye aspect ratio
+            mar (float): Mouth aspect ratio
         """
-        height, width = frame.shape[:2]
+        # The panel is re-rendered only when the text it shows changes
+        if face_detected:
+            key = (True, eyes_closed, yawning, f"EAR: {ear:.3f}", f"MAR: {mar:.3f}")
+        else:
+            key = (False, False, False, "", "")
         
-        # Position
-        x = width - 220
-        y = 80
+        if key != self._status_key:
+            self._status_key = key
+            self._status_sprite = self._render_status_panel(*key)
         
-        # FIX #1: Only show status if face is detected
-        face_detected = drowsiness_data.get('face_detected', True)
+        self._blit_sprite(frame, self._status_sprite, self._status_x, self._status_y)
+    
+    def trigger_alert(self, drowsiness_data):
+        """
+        Trigger appropriate alerts based on drowsiness data.
         
-        if not face_detected:
-            # Show "No Face Detected" message
-            cv2.putText(frame, "No Face Detected", (x, y), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 2)
+        Args:
+            drowsiness_data (dict): Drowsiness detection results
+        """
+        if not self.audio_initialized:
             return
         
-        # Eyes status
-        eye_status = "CLOSED" if drowsiness_data['eyes_closed'] else "OPEN"
-        eye_color = Config.COLOR_DANGER if drowsiness_data['eyes_closed'] else Config.COLOR_NORMAL
-        cv2.putText(frame, f"Eyes: {eye_status}", (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, eye_color, 2)
-        
-        # Yawn status
-        yawn_status = "YAWNING" if drowsiness_data['yawning'] else "NORMAL"
-        yawn_color = Config.COLOR_WARNING if drowsiness_data['yawning'] else Config.COLOR_NORMAL
-        cv2.putText(frame, f"Mouth: {yawn_status}", (x, y + 25), cv2.FONT_HERSHEY_SIMPLEX, 0.5, yawn_color, 2)
+        self._trigger_audio(drowsiness_data['alert_level'], drowsiness_data['drowsiness_score'])
+    
+    def trigger_phone_alert(self):
+        """
+        Trigger the audio alert for detected phone usage.
         
-        # EAR value
-        cv2.putText(frame, f"EAR: {drowsiness_data['ear']:.3f}", (x, y + 50), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
+        Phone usage is treated as a DANGER level at the maximum score, so it
+        sounds the continuous alarm when enabled and the beep otherwise.
+        """
+        if not self.audio_initialized:
+            return
         
-        # MAR value
-        cv2.putText(frame, f"MAR: {drowsiness_data['mar']:.3f}", (x, y + 70), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
+        self._trigger_audio("DANGER", self._phone_alert_score)
     
-    def trigger_alert(self, drowsiness_data):
+    def _trigger_audio(self, alert_level, drowsiness_score):
         """
-        Trigger appropriate alerts based on drowsiness data.
+        Enter play_alert only when it can change what is playing.
         
         Args:
-            drowsiness_data (dict): Drowsiness detection results
+            alert_level (str): "NORMAL", "WARNING", or "DANGER"
+            drowsiness_score (float): Current drowsiness score
         """
-        alert_level = drowsiness_data['alert_level']
-        drowsiness_score = drowsiness_data['drowsiness_score']
-        
         # Play audio alert (FIX #4: pass score for continuous alarm)
-        if alert_level in ["WARNING", "DANGER"] or drowsiness_score >= Config.CONTINUOUS_ALARM_THRESHOLD:
+        if self._continuous_alarm_enabled and drowsiness_score >= self._continuous_alarm_threshold:
+            self.play_alert(alert_level, drowsiness_score)
+        elif self.continuous_alarm_active:
+            # The looping alarm must be switched off whatever the alert level
             self.play_alert(alert_level, drowsiness_score)
+        elif alert_level in _ALERTING_LEVELS:
+            # During the cooldown a beep cannot play
+            current_ms = time.monotonic_ns() // 1_000_000
+            if current_ms - self.last_audio_alert_ms >= self._cooldown_ms:
+                self.play_alert(alert_level, drowsiness_score)
     
     def cleanup(self):
         """Clean up audio resources."""
+        if self._audio_thread is not None:
+            # Drop any pending sound and stop the worker
+            try:
+                self._audio_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._audio_queue.put(None)
+            self._audio_thread.join(timeout=1.0)
+            self._audio_thread = None
+        
         if self.audio_initialized:
             try:
-                pygame.mixer.quit()
+                self._pygame.mixer.quit()
                 log.info("Audio system cleaned up")
             except:
                 pass
\ No newline at end of file
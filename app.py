@@ -9,6 +9,10 @@ Real-time detection of:
 
 import cv2
 import sys
+import numpy as np
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import mediapipe as mp
 from config.settings import Config
 from camera.video_capture import VideoCapture
@@ -22,6 +26,7 @@ from utils.visualization import (
     draw_bounding_box,
     draw_eye_landmarks,
     draw_mouth_landmarks,
+    draw_points,
     draw_fps,
     draw_dashboard,
     draw_no_face_message
@@ -29,6 +34,26 @@ from utils.visualization import (
 from utils.logger import log
 
 
+WINDOW_NAME = "Driver Safety Monitoring System"
+
+PHONE_ALERT_MESSAGE = "PHONE USAGE DETECTED! FOCUS ON DRIVING LEAVE THE PHONE!"
+PHONE_LABEL = "Phone"
+
+# Minimum frames between repeated per-frame error logs
+ERROR_LOG_INTERVAL = 60
+
+# Hand skeleton connections (simplified), as landmark index pairs
+HAND_CONNECTIONS = np.array([
+    (0, 1), (1, 2), (2, 3), (3, 4),  # Thumb
+    (0, 5), (5, 6), (6, 7), (7, 8),  # Index
+    (0, 9), (9, 10), (10, 11), (11, 12),  # Middle
+    (0, 13), (13, 14), (14, 15), (15, 16),  # Ring
+    (0, 17), (17, 18), (18, 19), (19, 20),  # Pinky
+], dtype=np.int32)
+HAND_CONNECTIONS.setflags(write=False)
+NUM_HAND_LANDMARKS = 21
+
+
 class DriverSafetyApp:
     """Main application class for driver safety monitoring system."""
     
@@ -54,6 +79,51 @@ class DriverSafetyApp:
                 min_tracking_confidence=Config.HAND_TRACKING_CONFIDENCE
             )
         
+        # Face and hand detection run every FACE_/HAND_DETECTION_INTERVAL
+        # frames; the last result is reused in between, together with its
+        # analysis: (face_info, scaled_bbox, drowsiness_data) for faces, the
+        # phone detection result for hands
+        self._face_detection_interval = max(1, Config.FACE_DETECTION_INTERVAL)
+        self._hand_detection_interval = max(1, Config.HAND_DETECTION_INTERVAL)
+        self._frame_index = 0
+        self._last_faces = []
+        self._last_face_analysis = None
+        self._last_hands = (0, [])
+        self._last_phone_data = None
+        
+        # BGR drawing buffer for DRAW_AT_PROCESSED, reused across frames
+        self._canvas_buf = None
+        
+        # Pixel coordinates of the detected hands, filled in place each detection
+        self._hand_buf = np.empty((Config.MAX_NUM_HANDS, NUM_HAND_LANDMARKS, 2), dtype=np.int32)
+        self._last_hand_error_frame = -ERROR_LOG_INTERVAL
+        
+        # Hand detection runs on a worker while faces are detected on the
+        # calling thread; each detector is still used by one thread at a time
+        self._hand_pool = None
+        if self.hands:
+            self._hand_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="HandDetection")
+        
+        # Screenshots are encoded and written off the processing thread
+        self._screenshot_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Screenshot")
+        
+        # Overlay drawing target (see Config.DRAW_AT_PROCESSED)
+        self._draw_at_processed = Config.DRAW_AT_PROCESSED
+        
+        # Config values used on every frame, read once
+        self._hand_color = Config.HAND_COLOR
+        self._color_phone = Config.COLOR_PHONE
+        self._color_normal = Config.COLOR_NORMAL
+        
+        # Solid phone banner block and its outlined text sprite, rebuilt only
+        # when the frame width changes
+        self._phone_banner_block = None
+        self._phone_text_sprite = None
+        
+        # Text metrics of the constant phone alert strings
+        self._phone_banner_text_size = cv2.getTextSize(PHONE_ALERT_MESSAGE, cv2.FONT_HERSHEY_SIMPLEX, 1.0, 3)[0]
+        self._phone_label_size = cv2.getTextSize(PHONE_LABEL, Config.FPS_FONT, 0.6, 2)[0]
+        
         # Create necessary directories
         Config.create_directories()
     
@@ -105,41 +175,47 @@ class DriverSafetyApp:
         Detect hands in frame using MediaPipe.
         
         Args:
-            frame (np.ndarray): Input frame (BGR)
+            frame (np.ndarray): Input frame (RGB)
         
         Returns:
-            tuple: (num_hands, hand_landmarks_list)
+            tuple: (num_hands, hand_landmarks_list) where hand_landmarks_list
+                is a (num_hands, 21, 2) int32 view of a reused buffer that
+                callers must not modify
         """
-        if not Config.ENABLE_HAND_DETECTION or not self.hands:
+        # self.hands is only created when hand detection is enabled
+        if not self.hands:
             return 0, []
         
         try:
-            # Convert to RGB
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Process frame
-            results = self.hands.process(rgb_frame)
+            # Process frame (already RGB, as MediaPipe expects)
+            results = self.hands.process(frame)
             
             # Extract hand landmarks
             if results.multi_hand_landmarks:
-                hand_landmarks_list = []
                 h, w = frame.shape[:2]
+                num_hands = min(len(results.multi_hand_landmarks), len(self._hand_buf))
                 
-                for hand_landmarks in results.multi_hand_landmarks:
+                for i in range(num_hands):
                     # Convert normalized coordinates to pixel coordinates
-                    landmarks = []
-                    for landmark in hand_landmarks.landmark:
-                        x = int(landmark.x * w)
-                        y = int(landmark.y * h)
-                        landmarks.append((x, y))
-                    hand_landmarks_list.append(landmarks)
+                    # (the int32 assignment truncates like int())
+                    coords = np.fromiter(
+                        (value for landmark in results.multi_hand_landmarks[i].landmark
+                         for value in (landmark.x, landmark.y)),
+                        dtype=np.float64,
+                        count=2 * NUM_HAND_LANDMARKS
+                    ).reshape(NUM_HAND_LANDMARKS, 2)
+                    coords *= (w, h)
+                    self._hand_buf[i] = coords
                 
-                return len(hand_landmarks_list), hand_landmarks_list
+                return num_hands, self._hand_buf[:num_hands]
             
             return 0, []
             
         except Exception as e:
-            log.error(f"Error detecting hands: {e}")
+            # A failing graph fails on every frame; log it once per interval
+            if self._frame_index - self._last_hand_error_frame >= ERROR_LOG_INTERVAL:
+                self._last_hand_error_frame = self._frame_index
+                log.error(f"Error detecting hands: {e}")
             return 0, []
     
     def draw_hand_landmarks(self, frame, hand_landmarks_list):
@@ -148,30 +224,29 @@ class DriverSafetyApp:
         
         Args:
             frame (np.ndarray): Input frame
-            hand_landmarks_list (list): List of hand landmarks
+            hand_landmarks_list (np.ndarray): (num_hands, 21, 2) hand landmarks
         """
-        if not hand_landmarks_list:
+        if len(hand_landmarks_list) == 0:
             return
         
+        color = self._hand_color
+        joints = []
+        segments = []
         for hand_landmarks in hand_landmarks_list:
-            # Draw hand skeleton
-            for i, point in enumerate(hand_landmarks):
-                cv2.circle(frame, point, 3, Config.HAND_COLOR, -1)
-            
-            # Draw connections (simplified)
-            connections = [
-                (0, 1), (1, 2), (2, 3), (3, 4),  # Thumb
-                (0, 5), (5, 6), (6, 7), (7, 8),  # Index
-                (0, 9), (9, 10), (10, 11), (11, 12),  # Middle
-                (0, 13), (13, 14), (14, 15), (15, 16),  # Ring
-                (0, 17), (17, 18), (18, 19), (19, 20),  # Pinky
-            ]
+            points = np.asarray(hand_landmarks, dtype=np.int32)
+            joints.append(points)
             
-            for start_idx, end_idx in connections:
-                if start_idx < len(hand_landmarks) and end_idx < len(hand_landmarks):
-                    start = hand_landmarks[start_idx]
-                    end = hand_landmarks[end_idx]
-                    cv2.line(frame, start, end, Config.HAND_COLOR, 2)
+            # Gather (start, end) point pairs; MediaPipe always returns the
+            # full hand, so the table is only filtered for partial input
+            if len(points) >= NUM_HAND_LANDMARKS:
+                segments.append(points[HAND_CONNECTIONS])
+            else:
+                present = (HAND_CONNECTIONS < len(points)).all(axis=1)
+                segments.append(points[HAND_CONNECTIONS[present]])
+        
+        # Draw the joints, then the connections, of all hands in one call each
+        draw_points(frame, np.concatenate(joints), 3, color)
+        cv2.polylines(frame, np.concatenate(segments), False, color, 2)
     
     def draw_phone_alert(self, frame, phone_data):
         """
@@ -184,28 +259,49 @@ class DriverSafetyApp:
         if not phone_data['phone_detected']:
             return
         
-        height, width = frame.shape[:2]
-        
         # Draw MAGENTA banner for phone usage
         color = Config.COLOR_PHONE
-        message = "PHONE USAGE DETECTED! FOCUS ON DRIVING LEAVE THE PHONE!"
         banner_height = 90
         
-        # Draw semi-transparent banner
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (width, banner_height), color, -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+        # Draw semi-transparent banner (blend only the banner rows in place;
+        # the rows are inclusive of banner_height, as with cv2.rectangle)
+        roi = frame[:banner_height + 1]
+        if self._phone_banner_block is None or self._phone_banner_block.shape != roi.shape:
+            self._phone_banner_block = np.full(roi.shape, color, dtype=np.uint8)
+            self._phone_text_sprite = self._render_phone_text(roi.shape[:2], banner_height)
+        cv2.addWeighted(self._phone_banner_block, 0.7, roi, 0.3, 0, dst=roi)
+        
+        # Draw message (outline and fill pre-rendered, copied in one pass)
+        image, mask = self._phone_text_sprite
+        np.copyto(roi, image, where=mask)
+    
+    def _render_phone_text(self, shape, banner_height):
+        """
+        Render the outlined phone alert message into a sprite.
+        
+        Args:
+            shape (tuple): (height, width) of the banner rows
+            banner_height (int): Banner height in pixels
         
-        # Draw message
+        Returns:
+            tuple: (image, mask) sprite covering the banner rows
+        """
+        message = PHONE_ALERT_MESSAGE
         font = cv2.FONT_HERSHEY_SIMPLEX
         font_scale = 1.0
-        text_size = cv2.getTextSize(message, font, font_scale, 3)[0]
-        text_x = (width - text_size[0]) // 2
+        text_size = self._phone_banner_text_size
+        text_x = (shape[1] - text_size[0]) // 2
         text_y = banner_height // 2 + text_size[1] // 2
         
+        image = np.zeros((*shape, 3), dtype=np.uint8)
+        mask = np.zeros(shape, dtype=np.uint8)
+        
         # Draw text with outline
-        cv2.putText(frame, message, (text_x, text_y), font, font_scale, (0, 0, 0), 5)
-        cv2.putText(frame, message, (text_x, text_y), font, font_scale, (255, 255, 255), 3)
+        cv2.putText(image, message, (text_x, text_y), font, font_scale, (0, 0, 0), 5)
+        cv2.putText(mask, message, (text_x, text_y), font, font_scale, 255, 5)
+        cv2.putText(image, message, (text_x, text_y), font, font_scale, (255, 255, 255), 3)
+        
+        return image, mask.astype(bool)[:, :, None]
     
     def draw_phone_status(self, frame, phone_data):
         """
@@ -221,12 +317,12 @@ class DriverSafetyApp:
         
         # Phone status
         phone_status = "DETECTED" if phone_data['phone_detected'] else "NOT DETECTED"
-        phone_color = Config.COLOR_PHONE if phone_data['phone_detected'] else Config.COLOR_NORMAL
+        phone_color = self._color_phone if phone_data['phone_detected'] else self._color_normal
         cv2.putText(frame, f"Phone: {phone_status}", (x, y), 
                     cv2.FONT_HERSHEY_SIMPLEX, 0.5, phone_color, 2)
         
         # Confidence
-        if Config.ENABLE_HAND_DETECTION:
+        if self.hands:
             cv2.putText(frame, f"Conf: {phone_data['confidence']:.2f}", (x, y + 20), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
     
@@ -252,16 +348,38 @@ class DriverSafetyApp:
         
         Args:
             original_frame (np.ndarray): Original resolution frame for display
-            processed_frame (np.ndarray): Resized frame for processing
+            processed_frame (np.ndarray): Resized RGB frame for processing
         
         Returns:
             np.ndarray: Processed frame with visualizations
         """
-        # Detect faces
-        faces = self.detector.detect_faces(processed_frame)
+        # Both MediaPipe graphs need C-contiguous input; make one copy here
+        # rather than one per detector (camera frames already are contiguous)
+        if not processed_frame.flags['C_CONTIGUOUS']:
+            processed_frame = np.ascontiguousarray(processed_frame)
+            processed_frame.flags.writeable = False
+        
+        # If configured, face and hand detection are skipped on interval
+        # frames and the previous result is reused. A skipped frame reuses
+        # the previous drowsiness or phone analysis as well, so their frame
+        # counters only ever see fresh samples.
+        frame_index = self._frame_index
+        self._frame_index += 1
         
         # Detect hands (for phone detection)
-        num_hands, hand_landmarks_list = self.detect_hands(processed_frame)
+        hands_future = None
+        if self._hand_pool is not None and frame_index % self._hand_detection_interval == 0:
+            hands_future = self._hand_pool.submit(self.detect_hands, processed_frame)
+        
+        # Detect faces (MediaPipe releases the GIL, so this overlaps hands)
+        faces_fresh = frame_index % self._face_detection_interval == 0
+        if faces_fresh:
+            self._last_faces = self.detector.detect_faces(processed_frame)
+        faces = self._last_faces
+        
+        if hands_future is not None:
+            self._last_hands = hands_future.result()
+        num_hands, hand_landmarks_list = self._last_hands
         
         # Calculate scaling factors
         h_orig, w_orig = original_frame.shape[:2]
@@ -269,6 +387,18 @@ class DriverSafetyApp:
         scale_x = w_orig / w_proc
         scale_y = h_orig / h_proc
         
+        # Overlays go on the original frame, or on the processed frame which
+        # is then upscaled once; the latter needs no per-landmark scaling
+        # and draws on far fewer pixels
+        draw_at_processed = self._draw_at_processed
+        if draw_at_processed:
+            # The processed frame is RGB; draw on a BGR copy of it
+            if self._canvas_buf is None or self._canvas_buf.shape != processed_frame.shape:
+                self._canvas_buf = np.empty_like(processed_frame)
+            canvas = cv2.cvtColor(processed_frame, cv2.COLOR_RGB2BGR, dst=self._canvas_buf)
+        else:
+            canvas = original_frame
+        
         # Default data
         drowsiness_data = None
         phone_data = None
@@ -276,81 +406,101 @@ class DriverSafetyApp:
         
         # If no faces detected
         if len(faces) == 0:
-            draw_no_face_message(original_frame)
+            draw_no_face_message(canvas)
             drowsiness_data = self.drowsiness_detector._get_default_result()
             phone_data = self.phone_detector._get_result(False, 0.0, [], None)
         else:
-            # Process the first face (driver)
-            face = faces[0]
-            
-            # Get face information
-            face_info = self.detector.get_face_info(face, w_proc, h_proc)
+            if faces_fresh or self._last_face_analysis is None:
+                # Process the first face (driver)
+                face = faces[0]
+                
+                # Get face information
+                face_info = self.detector.get_face_info(face, w_proc, h_proc)
+                
+                # Scale bounding box
+                bbox = face_info['bbox']
+                scaled_bbox = (
+                    int(bbox[0] * scale_x),
+                    int(bbox[1] * scale_y),
+                    int(bbox[2] * scale_x),
+                    int(bbox[3] * scale_y)
+                )
+                
+                # Scale landmarks
+                scaled_landmarks = self.tracker.scale_landmarks(
+                    face_info['landmarks'],
+                    scale_x,
+                    scale_y
+                )
+                
+                # DROWSINESS DETECTION
+                drowsiness_data = self.drowsiness_detector.detect_drowsiness(scaled_landmarks)
+                self._last_face_analysis = (face_info, scaled_bbox, drowsiness_data)
+            else:
+                # Same face as last frame: analysing it again would only feed
+                # the drowsiness counters a duplicate sample
+                face_info, scaled_bbox, drowsiness_data = self._last_face_analysis
             
-            # Scale bounding box
-            bbox = face_info['bbox']
-            scaled_bbox = (
-                int(bbox[0] * scale_x),
-                int(bbox[1] * scale_y),
-                int(bbox[2] * scale_x),
-                int(bbox[3] * scale_y)
-            )
             face_bbox = scaled_bbox
             
             # Draw bounding box
             draw_bounding_box(
-                original_frame,
-                scaled_bbox,
+                canvas,
+                face_info['bbox'] if draw_at_processed else scaled_bbox,
                 face_info['confidence']
             )
             
-            # Scale landmarks
-            scaled_landmarks = self.tracker.scale_landmarks(
-                face_info['landmarks'],
-                scale_x,
-                scale_y
-            )
-            
-            # DROWSINESS DETECTION
-            drowsiness_data = self.drowsiness_detector.detect_drowsiness(scaled_landmarks)
+            # Eye and mouth landmarks come back in original frame coordinates
+            if draw_at_processed:
+                points = np.asarray(face_info['landmarks'])
+                left_eye = points[DrowsinessDetector.LEFT_EYE_INDICES]
+                right_eye = points[DrowsinessDetector.RIGHT_EYE_INDICES]
+                mouth = points[DrowsinessDetector.MOUTH_OUTLINE_INDICES]
+            else:
+                left_eye = drowsiness_data['left_eye_landmarks']
+                right_eye = drowsiness_data['right_eye_landmarks']
+                mouth = drowsiness_data['mouth_landmarks']
             
             # Draw eye landmarks
-            left_eye = [(int(x * scale_x), int(y * scale_y)) 
-                        for x, y in drowsiness_data['left_eye_landmarks']]
-            right_eye = [(int(x * scale_x), int(y * scale_y)) 
-                         for x, y in drowsiness_data['right_eye_landmarks']]
-            
             draw_eye_landmarks(
-                original_frame,
+                canvas,
                 left_eye,
                 right_eye,
                 drowsiness_data['eyes_closed']
             )
             
             # Draw mouth landmarks
-            mouth = [(int(x * scale_x), int(y * scale_y)) 
-                     for x, y in drowsiness_data['mouth_landmarks']]
-            
             draw_mouth_landmarks(
-                original_frame,
+                canvas,
                 mouth,
                 drowsiness_data['yawning']
             )
             
             # PHONE DETECTION (if hands detected)
             if num_hands > 0:
-                # Scale hand landmarks
-                scaled_hand_landmarks = []
-                for hand_landmarks in hand_landmarks_list:
-                    scaled_hand = [(int(x * scale_x), int(y * scale_y)) for x, y in hand_landmarks]
-                    scaled_hand_landmarks.append(scaled_hand)
+                # Scale hand landmarks, all hands in one pass
+                if draw_at_processed:
+                    scaled_hand_landmarks = hand_landmarks_list
+                else:
+                    scaled_hand_landmarks = self.tracker.scale_landmarks(
+                        hand_landmarks_list,
+                        scale_x,
+                        scale_y
+                    )
                 
-                # Detect phone usage
-                phone_data = self.phone_detector.detect_phone_usage(
-                    num_hands,
-                    hand_landmarks_list,  # Use unscaled for detection
-                    face_info['landmarks'],
-                    bbox
-                )
+                if hands_future is not None or self._last_phone_data is None:
+                    # Detect phone usage
+                    phone_data = self.phone_detector.detect_phone_usage(
+                        num_hands,
+                        hand_landmarks_list,  # Use unscaled for detection
+                        face_info['landmarks'],
+                        face_info['bbox']
+                    )
+                    self._last_phone_data = phone_data
+                else:
+                    # Same hands as last frame: detecting again would only
+                    # advance the phone counters on a duplicate sample
+                    phone_data = self._last_phone_data
                 
                 # Draw phone bounding box if detected
                 if phone_data and phone_data.get('phone_bbox'):
@@ -358,19 +508,19 @@ class DriverSafetyApp:
                     x1, y1, x2, y2 = phone_bbox
                     
                     # Draw magenta box around phone
-                    cv2.rectangle(original_frame, (x1, y1), (x2, y2),
+                    cv2.rectangle(canvas, (x1, y1), (x2, y2),
                                  Config.PHONE_BBOX_COLOR, Config.PHONE_BBOX_THICKNESS)
                     
                     # Draw "Phone" label
-                    label = "Phone"
-                    label_size = cv2.getTextSize(label, Config.FPS_FONT, 0.6, 2)[0]
-                    cv2.rectangle(original_frame, (x1, y1 - label_size[1] - 10),
+                    label = PHONE_LABEL
+                    label_size = self._phone_label_size
+                    cv2.rectangle(canvas, (x1, y1 - label_size[1] - 10),
                                  (x1 + label_size[0] + 10, y1), Config.PHONE_BBOX_COLOR, -1)
-                    cv2.putText(original_frame, label, (x1 + 5, y1 - 5),
+                    cv2.putText(canvas, label, (x1 + 5, y1 - 5),
                                Config.FPS_FONT, 0.6, (255, 255, 255), 2)
                 
                 # Draw hand landmarks
-                self.draw_hand_landmarks(original_frame, scaled_hand_landmarks)
+                self.draw_hand_landmarks(canvas, scaled_hand_landmarks)
             else:
                 # No hands detected
                 phone_data = self.phone_detector._get_result(False, 0.0, [], face_info['landmarks'])
@@ -378,75 +528,179 @@ class DriverSafetyApp:
         # PRIORITY ALERT SYSTEM
         # Phone usage has HIGHEST priority
         if phone_data and phone_data['phone_detected']:
-            self.draw_phone_alert(original_frame, phone_data)
+            self.draw_phone_alert(canvas, phone_data)
             # Still show drowsiness overlay below
             if drowsiness_data:
-                self.alert_system.draw_alert_overlay(original_frame, drowsiness_data)
+                self.alert_system.draw_alert_overlay(canvas, drowsiness_data)
         elif drowsiness_data:
             # Show drowsiness alert if no phone
-            self.alert_system.draw_alert_overlay(original_frame, drowsiness_data)
+            self.alert_system.draw_alert_overlay(canvas, drowsiness_data)
         
         # Draw status indicators
         if phone_data:
-            self.draw_phone_status(original_frame, phone_data)
-        
-        # Trigger audio alerts
-        if drowsiness_data:
-            self.alert_system.trigger_alert(drowsiness_data)
+            self.draw_phone_status(canvas, phone_data)
         
+        # Trigger audio alerts. The phone alert already sounds at the highest
+        # level, so the drowsiness alert is only evaluated without a phone;
+        # triggering both would start and stop the continuous alarm each frame.
         if phone_data and phone_data['phone_detected']:
-            # Additional phone alert (could use different sound)
-            self.alert_system.trigger_alert({'alert_level': 'DANGER', 'drowsiness_score': 100})
+            self.alert_system.trigger_phone_alert()
+        elif drowsiness_data:
+            self.alert_system.trigger_alert(drowsiness_data)
         
         # Draw combined dashboard
         if drowsiness_data and phone_data:
             combined_stats = self.update_dashboard(drowsiness_data, phone_data)
-            draw_dashboard(original_frame, combined_stats)
+            draw_dashboard(canvas, combined_stats)
+        
+        if draw_at_processed:
+            # Single upscale to display resolution, into the original frame
+            cv2.resize(canvas, (w_orig, h_orig), dst=original_frame)
         
         return original_frame
     
+    @staticmethod
+    def _show_frame(frame, key_q):
+        """
+        Show a frame and forward a pressed key, if any.
+        
+        Args:
+            frame (np.ndarray): Frame to show
+            key_q (queue.Queue): Queue receiving pressed key codes
+        """
+        cv2.imshow(WINDOW_NAME, frame)
+        
+        # pollKey handles window events without waitKey's 1 ms sleep
+        key = cv2.pollKey() & 0xFF
+        if key != 0xFF:
+            key_q.put(key)
+    
+    @staticmethod
+    def _offer_latest(display_q, item):
+        """
+        Put an item on a single-slot queue, replacing one not yet taken.
+        
+        Args:
+            display_q (queue.Queue): Single-slot queue (this is its only producer)
+            item: Item to put
+        """
+        try:
+            display_q.put_nowait(item)
+        except queue.Full:
+            # Drop the older frame; the display only needs the latest
+            try:
+                display_q.get_nowait()
+            except queue.Empty:
+                pass
+            display_q.put_nowait(item)
+    
+    def _display_loop(self, display_q, key_q):
+        """
+        Display stage: show processed frames and forward key presses.
+        
+        Args:
+            display_q (queue.Queue): Single-slot queue of frames, None to stop
+            key_q (queue.Queue): Queue receiving pressed key codes
+        """
+        while True:
+            frame = display_q.get()
+            if frame is None:
+                break
+            
+            self._show_frame(frame, key_q)
+    
+    @staticmethod
+    def _save_screenshot(filename, frame):
+        """
+        Write a screenshot to disk (runs on the screenshot worker).
+        
+        Args:
+            filename (str): Output PNG path
+            frame (np.ndarray): Frame to save
+        """
+        # Light PNG compression: faster to encode than the default level,
+        # still lossless
+        if cv2.imwrite(filename, frame, [cv2.IMWRITE_PNG_COMPRESSION, 1]):
+            log.info(f"Screenshot saved: {filename}")
+        else:
+            log.error(f"Could not save screenshot: {filename}")
+    
     def run(self):
-        """Main application loop."""
+        """
+        Main application loop.
+        
+        Capture, processing and display run as a pipeline: the camera's
+        capture thread decodes frame N+1 and a display thread paints frame
+        N-1 while this thread runs detection on frame N. Detection stays on
+        this thread, so the detectors need no locking.
+        """
         if not self.initialize():
             log.error("Initialization failed. Exiting...")
             return
         
         log.info("Starting driver safety monitoring. Stay safe!")
         
+        display_q = queue.Queue(maxsize=1)
+        key_q = queue.Queue()
+        
+        # HighGUI must run on the main thread on macOS
+        display = None
+        if sys.platform != "darwin":
+            display = threading.Thread(target=self._display_loop, args=(display_q, key_q),
+                                       name="FrameDisplay", daemon=True)
+            display.start()
+        
+        # Bound methods used on every iteration, looked up once
+        read_frame = self.camera.read_frame
+        process_frame = self.process_frame
+        update_fps = self.fps_counter.update
+        get_fps = self.fps_counter.get_fps
+        
         try:
             while True:
-                # Read frame from camera
-                ret, original_frame, processed_frame = self.camera.read_frame()
+                # Read the latest frame from the capture thread
+                ret, original_frame, processed_frame = read_frame()
                 
                 if not ret:
+                    # A stopped camera will not recover; retrying would spin
+                    # with a frozen window that no longer takes 'q'
+                    if not self.camera.is_opened:
+                        log.error("Camera stopped. Exiting...")
+                        break
                     log.warning("Failed to capture frame. Retrying...")
                     continue
                 
                 # Process frame
-                output_frame = self.process_frame(original_frame, processed_frame)
+                output_frame = process_frame(original_frame, processed_frame)
                 
                 # Update FPS counter
-                self.fps_counter.update()
-                fps = self.fps_counter.get_fps()
+                update_fps()
+                fps = get_fps()
                 
                 # Draw FPS on frame
                 draw_fps(output_frame, fps)
                 
-                # Display frame
-                cv2.imshow("Driver Safety Monitoring System", output_frame)
+                # Hand frame to the display stage; processing never waits on
+                # the display, a frame it has not shown yet is replaced
+                if display is not None:
+                    self._offer_latest(display_q, output_frame)
+                else:
+                    self._show_frame(output_frame, key_q)
                 
                 # Check for key press
-                key = cv2.waitKey(1) & 0xFF
+                try:
+                    key = key_q.get_nowait()
+                except queue.Empty:
+                    continue
                 
                 if key == ord('q'):
                     log.info("Quit signal received")
                     break
                 
                 elif key == ord('s'):
-                    # Save screenshot
+                    # Save screenshot (the frame is not modified after this)
                     filename = f"safety_screenshot_{int(self.fps_counter.frame_count)}.png"
-                    cv2.imwrite(filename, output_frame)
-                    log.info(f"Screenshot saved: {filename}")
+                    self._screenshot_pool.submit(self._save_screenshot, filename, output_frame)
                 
                 elif key == ord('r'):
                     # Reset statistics
@@ -463,6 +717,11 @@ class DriverSafetyApp:
             traceback.print_exc()
         
         finally:
+            # Stop the display stage before the windows are released (the
+            # camera stops its capture thread itself)
+            if display is not None:
+                self._offer_latest(display_q, None)
+                display.join(timeout=1.0)
             self.cleanup()
     
     def cleanup(self):
@@ -472,6 +731,12 @@ class DriverSafetyApp:
         self.detector.release()
         self.alert_system.cleanup()
         
+        if self._hand_pool is not None:
+            self._hand_pool.shutdown(wait=True)
+        
+        # Let pending screenshots finish writing
+        self._screenshot_pool.shutdown(wait=True)
+        
         if self.hands:
             self.hands.close()
         
@@ -2,20 +2,125 @@
 Video capture module for handling webcam input.
 """
 
+import threading
 import cv2
 import numpy as np
 from config.settings import Config
 from utils.logger import log
 
 
+class LatestFrameSlot:
+    """
+    Single-slot mailbox between the capture thread and its consumer.
+    
+    put() overwrites whatever is waiting, so the consumer only ever sees
+    the most recent item and never a backlog; get() waits for one.
+    """
+    
+    def __init__(self):
+        """Initialize an empty slot."""
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._item = None
+    
+    def put(self, item):
+        """
+        Store an item, dropping any item not yet taken.
+        
+        Args:
+            item: Item to store (not None)
+        """
+        with self._lock:
+            self._item = item
+            self._ready.set()
+    
+    def get(self, timeout=None):
+        """
+        Take the stored item, waiting for one if the slot is empty.
+        
+        Args:
+            timeout (float, optional): Seconds to wait
+        
+        Returns:
+            The stored item, or None if none arrived in time
+        """
+        if not self._ready.wait(timeout):
+            return None
+        
+        with self._lock:
+            item = self._item
+            self._item = None
+            self._ready.clear()
+        
+        return item
+    
+    def empty(self):
+        """
+        Check whether the slot is empty.
+        
+        Returns:
+            bool: True if no item is waiting
+        """
+        return not self._ready.is_set()
+    
+    def clear(self):
+        """Drop any waiting item."""
+        with self._lock:
+            self._item = None
+            self._ready.clear()
+
+
 class VideoCapture:
-    """Handles webcam capture and frame preprocessing."""
+    """
+    Handles webcam capture and frame preprocessing.
+    
+    Once started, a background thread grabs frames continuously and keeps
+    the most recent decoded one for read_frame, so camera I/O and decoding
+    overlap with processing.
+    """
+    
+    # Seconds read_frame waits for the capture thread
+    READ_TIMEOUT = 1.0
+    
+    # After a failed grab the capture thread waits before retrying, doubling
+    # the wait from GRAB_RETRY_DELAY up to GRAB_RETRY_MAX_DELAY seconds. It
+    # warns once per ERROR_LOG_INTERVAL failures in a row and stops after
+    # MAX_GRAB_FAILURES (camera unplugged, end of a video file)
+    GRAB_RETRY_DELAY = 0.01
+    GRAB_RETRY_MAX_DELAY = 0.5
+    ERROR_LOG_INTERVAL = 10
+    MAX_GRAB_FAILURES = 30
+    
+    # Put in the frame slot when the capture thread stops on failures, to
+    # wake a waiting read_frame
+    _STOPPED = object()
     
     def __init__(self):
         """Initialize video capture."""
         self.cap = None
         self.is_opened = False
         
+        # Single slot holding the next (original, processed) frame pair
+        self._frames = LatestFrameSlot()
+        self._stop_event = threading.Event()
+        self._capture_thread = None
+        
+        # Processing size as cv2 expects it (width, height)
+        self._proc_size = (Config.PROCESS_WIDTH, Config.PROCESS_HEIGHT)
+        
+        # Frames are resized into a scratch buffer, then converted to RGB
+        # into two alternating buffers: the consumer holds one while the
+        # capture thread fills the other (the slot is only refilled after
+        # the previous frame has been taken)
+        self._resize_buf = np.empty(
+            (Config.PROCESS_HEIGHT, Config.PROCESS_WIDTH, 3), dtype=np.uint8
+        )
+        self._proc_bufs = [
+            np.empty((Config.PROCESS_HEIGHT, Config.PROCESS_WIDTH, 3), dtype=np.uint8)
+            for _ in range(2)
+        ]
+        self._proc_index = 0
+        
     def start(self, camera_id=None):
         """
         Start video capture from webcam.
@@ -37,46 +142,152 @@ class VideoCapture:
             log.error(f"Failed to open camera {camera_id}")
             return False
         
+        # Keep only the newest frame in the driver queue and ask for MJPEG,
+        # which USB cameras deliver faster at high resolutions. Not every
+        # backend supports these, so failures are not fatal.
+        try:
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        except cv2.error as e:
+            log.debug(f"Camera buffer/codec settings not applied: {e}")
+        
         # Set camera properties
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, Config.FRAME_WIDTH)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, Config.FRAME_HEIGHT)
         self.cap.set(cv2.CAP_PROP_FPS, Config.TARGET_FPS)
         
         self.is_opened = True
+        
+        # Start the capture thread
+        self._stop_event.clear()
+        self._capture_thread = threading.Thread(target=self._capture_loop, name="CameraCapture", daemon=True)
+        self._capture_thread.start()
+        
         log.info("Camera initialized successfully")
         
         return True
     
+    def _capture_loop(self):
+        """Grab frames continuously, decoding one whenever the slot is free."""
+        failures = 0
+        while not self._stop_event.is_set():
+            # Always grab so the camera never serves a stale frame, but only
+            # decode when the previous frame has been taken. The slot would
+            # drop an untaken frame anyway; skipping its decode saves the CPU
+            # and keeps the processed buffers from being overwritten in use.
+            if not self.grab():
+                # A failing camera fails at once; back off instead of spinning
+                failures += 1
+                if failures >= self.MAX_GRAB_FAILURES:
+                    # Stop for good: later reads fail at once, not per timeout
+                    log.error("Camera stopped delivering frames ({} failed grabs)", failures)
+                    self.is_opened = False
+                    self._frames.put(self._STOPPED)
+                    return
+                
+                if failures % self.ERROR_LOG_INTERVAL == 1:
+                    log.warning("Failed to grab frame ({} in a row)", failures)
+                
+                delay = min(self.GRAB_RETRY_DELAY * 2 ** (failures - 1), self.GRAB_RETRY_MAX_DELAY)
+                self._stop_event.wait(delay)
+                continue
+            
+            failures = 0
+            
+            if not self._frames.empty():
+                continue
+            
+            ret, frame, processed_frame = self.retrieve()
+            if ret:
+                self._frames.put((frame, processed_frame))
+    
     def read_frame(self):
         """
-        Read a frame from the camera.
+        Read the latest frame from the capture thread.
+        
+        Waits up to READ_TIMEOUT seconds for a frame. Once the capture
+        thread has given up, is_opened is False and every read fails at once.
         
         Returns:
             tuple: (success, original_frame, processed_frame)
                 - success (bool): Whether frame was read successfully
-                - original_frame (np.ndarray): Original resolution frame
-                - processed_frame (np.ndarray): Resized frame for processing
+                - original_frame (np.ndarray): Original resolution frame (BGR)
+                - processed_frame (np.ndarray): Resized frame for processing,
+                  already converted to RGB as MediaPipe expects
         """
         if not self.is_opened:
             log.warning("Camera not opened")
             return False, None, None
         
-        ret, frame = self.cap.read()
+        item = self._frames.get(timeout=self.READ_TIMEOUT)
+        if item is None:
+            log.warning("Failed to read frame")
+            return False, None, None
+        
+        # The capture thread gave up while we waited (already logged)
+        if item is self._STOPPED:
+            return False, None, None
+        
+        frame, processed_frame = item
+        return True, frame, processed_frame
+    
+    def grab(self):
+        """
+        Grab the next frame from the camera without decoding it.
+        
+        Grabbing keeps the camera drained; frames that will not be processed
+        can be skipped without paying for their decode. Called by the
+        capture thread, which logs and rate-limits failures.
+        
+        Returns:
+            bool: Whether a frame was grabbed
+        """
+        if not self.is_opened:
+            return False
+        
+        return self.cap.grab()
+    
+    def retrieve(self):
+        """
+        Decode the last grabbed frame, resize it and convert it to RGB.
+        
+        Converting after the resize touches only the small frame, and
+        spares the detectors a conversion of their own. The processed
+        frame is a read-only reused buffer, valid until the second
+        following retrieve().
+        
+        Returns:
+            tuple: (success, original_frame, processed_frame), as read_frame
+        """
+        ret, frame = self.cap.retrieve()
         
         if not ret:
             log.warning("Failed to read frame")
             return False, None, None
         
-        # Resize for faster processing
-        processed_frame = cv2.resize(
-            frame,
-            (Config.PROCESS_WIDTH, Config.PROCESS_HEIGHT)
-        )
+        # Resize for faster processing, then convert the small frame to RGB
+        cv2.resize(frame, self._proc_size, dst=self._resize_buf)
+        processed_frame = self._proc_bufs[self._proc_index]
+        processed_frame.flags.writeable = True
+        cv2.cvtColor(self._resize_buf, cv2.COLOR_BGR2RGB, dst=processed_frame)
+        self._proc_index ^= 1
+        
+        # MediaPipe takes read-only input by reference instead of copying it
+        processed_frame.flags.writeable = False
         
         return True, frame, processed_frame
     
     def release(self):
         """Release camera resources."""
+        # Stop the capture thread before the device goes away
+        if self._capture_thread is not None:
+            self._stop_event.set()
+            self._capture_thread.join(timeout=1.0)
+            self._capture_thread = None
+            
+            # Drop a frame left over for a later start()
+            self._frames.clear()
+        
         if self.cap is not None:
             self.cap.release()
             self.is_opened = False
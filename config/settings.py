@@ -31,6 +31,10 @@ class Config:
     DETECTION_CONFIDENCE = 0.5
     TRACKING_CONFIDENCE = 0.5
     MAX_NUM_FACES = 1
+    # Run face landmark inference every N frames. Skipped frames reuse the
+    # last drowsiness result, so EAR/MAR is sampled N times less often;
+    # only raise this where that is acceptable
+    FACE_DETECTION_INTERVAL = 1
     
     # ============================================================
     # HAND DETECTION SETTINGS
@@ -39,6 +43,10 @@ class Config:
     HAND_DETECTION_CONFIDENCE = 0.5
     HAND_TRACKING_CONFIDENCE = 0.5
     MAX_NUM_HANDS = 2
+    # Run hand detection every N frames. Skipped frames reuse the last phone
+    # result, so PHONE_CONSEC_FRAMES counts N times fewer observations per
+    # second; only raise this where that is acceptable
+    HAND_DETECTION_INTERVAL = 1
     
     # ============================================================
     # DROWSINESS DETECTION SETTINGS
@@ -95,6 +103,9 @@ class Config:
     COLOR_DANGER = (0, 0, 255)    # Red
     COLOR_PHONE = (255, 255, 0)   # Cyan (Replaced Magenta)
     
+    # Draw overlays at processing resolution and upscale once for display
+    DRAW_AT_PROCESSED = False
+    
     # Main Banner
     SHOW_NORMAL_BANNER = True
     NORMAL_BANNER_COLOR = (0, 200, 0)
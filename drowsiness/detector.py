@@ -3,8 +3,8 @@ Drowsiness detection module.
 Detects eye closure and yawning using facial landmarks.
 """
 
+from math import sqrt
 import numpy as np
-from scipy.spatial import distance
 from config.settings import Config
 from utils.logger import log
 
@@ -19,8 +19,22 @@ class DrowsinessDetector:
     # Right eye landmarks: 362, 385, 387, 263, 373, 380
     RIGHT_EYE_INDICES = [362, 385, 387, 263, 373, 380]
     
-    # Mouth landmarks for yawn detection
-    MOUTH_INDICES = [61, 291, 0, 17, 269, 405, 146, 91, 181, 84, 17, 314, 405, 321, 375, 291]
+    # Mouth landmarks for yawn detection, in MAR order:
+    # left corner, right corner, upper lip, lower lip, upper 2, lower 2
+    MOUTH_INDICES = [61, 291, 0, 17, 269, 181]
+    
+    # Mouth outline drawn on screen (not used for MAR)
+    MOUTH_OUTLINE_INDICES = [61, 291, 0, 17, 269, 405, 146, 91, 181, 84, 17, 314, 405, 321, 375, 291]
+    
+    # All feature indices (intp) in one array, so a frame needs a single
+    # NumPy gather; each feature is then a slice of the result
+    _FEATURE_IDX = np.array(
+        LEFT_EYE_INDICES + RIGHT_EYE_INDICES + MOUTH_INDICES + MOUTH_OUTLINE_INDICES,
+        dtype=np.intp
+    )
+    _RIGHT_EYE_START = len(LEFT_EYE_INDICES)
+    _MOUTH_START = _RIGHT_EYE_START + len(RIGHT_EYE_INDICES)
+    _MOUTH_OUTLINE_START = _MOUTH_START + len(MOUTH_INDICES)
     
     def __init__(self):
         """Initialize drowsiness detector."""
@@ -36,6 +50,9 @@ class DrowsinessDetector:
         self.is_yawning = False
         self.alert_level = "NORMAL"
         
+        # Score alert_level was last derived from (None forces a recompute)
+        self._alert_level_score = None
+        
         # Statistics
         self.total_eye_closures = 0
         self.total_yawns = 0
@@ -48,8 +65,53 @@ class DrowsinessDetector:
         self.last_eye_state = "OPEN"  # "OPEN" or "CLOSED"
         self.blink_counter = 0
         
+        # Thresholds read every frame, snapshotted from Config
+        self.reload_config()
+        
+        # Result dicts, reused every frame and updated in place: one for
+        # frames with a face, one for frames without (its other fields are
+        # constant). The empty landmark arrays must not be modified.
+        self._result = {}
+        no_landmarks = np.empty((0, 2), dtype=np.int32)
+        self._default_result = {
+            'ear': 0.0,
+            'mar': 0.0,
+            'eyes_closed': False,
+            'yawning': False,
+            'drowsiness_score': 0.0,
+            'alert_level': "NORMAL",
+            'eye_closure_counter': 0,
+            'yawn_counter': 0,
+            'total_eye_closures': 0,
+            'total_yawns': 0,
+            'left_eye_landmarks': no_landmarks,
+            'right_eye_landmarks': no_landmarks,
+            'mouth_landmarks': no_landmarks,
+            'face_detected': False
+        }
+        
         log.info("Drowsiness detector initialized with score=0")
     
+    def reload_config(self):
+        """
+        Snapshot the thresholds detect_drowsiness reads every frame.
+        
+        Call again after changing Config at runtime.
+        """
+        self._ear_threshold = float(Config.EAR_THRESHOLD)
+        self._ear_consec_frames = int(Config.EAR_CONSEC_FRAMES)
+        self._mar_threshold = float(Config.MAR_THRESHOLD)
+        self._mar_consec_frames = int(Config.MAR_CONSEC_FRAMES)
+        self._score_max = Config.DROWSINESS_SCORE_MAX
+        self._score_increment_eyes = Config.DROWSINESS_SCORE_INCREMENT_EYES
+        self._score_increment_yawn = Config.DROWSINESS_SCORE_INCREMENT_YAWN
+        self._score_decay = Config.DROWSINESS_SCORE_DECAY
+        self._alert_level_warning = Config.ALERT_LEVEL_WARNING
+        self._alert_level_danger = Config.ALERT_LEVEL_DANGER
+        
+        # The alert thresholds may have moved
+        self._alert_level_score = None
+    
     def calculate_eye_aspect_ratio(self, eye_landmarks):
         """
         Calculate Eye Aspect Ratio (EAR).
@@ -57,7 +119,7 @@ class DrowsinessDetector:
         EAR = (||p2-p6|| + ||p3-p5||) / (2 * ||p1-p4||)
         
         Args:
-            eye_landmarks (list): List of 6 eye landmark coordinates [(x, y), ...]
+            eye_landmarks (np.ndarray): (6, 2) eye landmark coordinates
         
         Returns:
             float: Eye aspect ratio
@@ -65,12 +127,19 @@ class DrowsinessDetector:
         if len(eye_landmarks) != 6:
             return 0.0
         
+        # Plain float math: for six points, NumPy call overhead would
+        # outweigh the arithmetic
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3), (x4, y4), (x5, y5) = np.asarray(eye_landmarks).tolist()
+        
         # Vertical distances
-        vertical1 = distance.euclidean(eye_landmarks[1], eye_landmarks[5])
-        vertical2 = distance.euclidean(eye_landmarks[2], eye_landmarks[4])
+        dx, dy = x1 - x5, y1 - y5
+        vertical1 = sqrt(dx * dx + dy * dy)
+        dx, dy = x2 - x4, y2 - y4
+        vertical2 = sqrt(dx * dx + dy * dy)
         
         # Horizontal distance
-        horizontal = distance.euclidean(eye_landmarks[0], eye_landmarks[3])
+        dx, dy = x0 - x3, y0 - y3
+        horizontal = sqrt(dx * dx + dy * dy)
         
         # EAR formula
         if horizontal == 0:
@@ -83,46 +152,50 @@ class DrowsinessDetector:
         """
         Calculate Mouth Aspect Ratio (MAR) for yawn detection.
         
+        MAR = (||p3-p4|| + ||p5-p6||) / (2 * ||p1-p2||)
+        
         Args:
-            mouth_landmarks (list): List of mouth landmark coordinates
+            mouth_landmarks (np.ndarray): (6, 2) mouth landmark coordinates,
+                ordered as MOUTH_INDICES
         
         Returns:
             float: Mouth aspect ratio
         """
-        if len(mouth_landmarks) < 14:
+        if len(mouth_landmarks) != 6:
             return 0.0
         
-        try:
-            # Use specific mouth landmarks for better detection
-            # Vertical distances (top to bottom of mouth)
-            vertical1 = distance.euclidean(mouth_landmarks[2], mouth_landmarks[10])
-            vertical2 = distance.euclidean(mouth_landmarks[4], mouth_landmarks[8])
-            
-            # Horizontal distance (left to right of mouth)
-            horizontal = distance.euclidean(mouth_landmarks[0], mouth_landmarks[1])
-            
-            if horizontal == 0:
-                return 0.0
-            
-            # MAR formula
-            mar = (vertical1 + vertical2) / (2.0 * horizontal)
-            return mar
-        except Exception as e:
-            log.debug(f"Error calculating MAR: {e}")
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3), (x4, y4), (x5, y5) = np.asarray(mouth_landmarks).tolist()
+        
+        # Vertical distances (top to bottom of mouth)
+        dx, dy = x2 - x3, y2 - y3
+        vertical1 = sqrt(dx * dx + dy * dy)
+        dx, dy = x4 - x5, y4 - y5
+        vertical2 = sqrt(dx * dx + dy * dy)
+        
+        # Horizontal distance (left to right of mouth)
+        dx, dy = x0 - x1, y0 - y1
+        horizontal = sqrt(dx * dx + dy * dy)
+        
+        if horizontal == 0:
             return 0.0
+        
+        # MAR formula
+        mar = (vertical1 + vertical2) / (2.0 * horizontal)
+        return mar
     
     def detect_drowsiness(self, all_landmarks):
         """
         Main drowsiness detection function.
         
         Args:
-            all_landmarks (list): All 468 facial landmarks [(x, y), ...]
+            all_landmarks (list or np.ndarray): All 468 facial landmarks [(x, y), ...]
         
         Returns:
-            dict: Detection results
+            dict: Detection results, reused and overwritten by the next call;
+                copy it to keep a snapshot
         """
         # Handle no face detection properly
-        if not all_landmarks or len(all_landmarks) < 468:
+        if all_landmarks is None or len(all_landmarks) < 468:
             self.face_detected = False
             self.no_face_counter += 1
             
@@ -130,6 +203,7 @@ class DrowsinessDetector:
             if self.no_face_counter > 3:
                 self.drowsiness_score = max(0, self.drowsiness_score - 10.0)
                 self.alert_level = "NORMAL"
+                self._alert_level_score = None
                 self.eye_closure_counter = 0
                 self.yawn_counter = 0
             
@@ -139,12 +213,12 @@ class DrowsinessDetector:
         self.face_detected = True
         self.no_face_counter = 0
         
-        # Extract eye landmarks
-        left_eye = [all_landmarks[i] for i in self.LEFT_EYE_INDICES]
-        right_eye = [all_landmarks[i] for i in self.RIGHT_EYE_INDICES]
-        
-        # Extract mouth landmarks
-        mouth = [all_landmarks[i] for i in self.MOUTH_INDICES if i < len(all_landmarks)]
+        # Extract eye and mouth landmarks as (N, 2) arrays, views of one gather
+        features = np.asarray(all_landmarks)[self._FEATURE_IDX]
+        left_eye = features[:self._RIGHT_EYE_START]
+        right_eye = features[self._RIGHT_EYE_START:self._MOUTH_START]
+        mouth = features[self._MOUTH_START:self._MOUTH_OUTLINE_START]
+        mouth_outline = features[self._MOUTH_OUTLINE_START:]
         
         # Calculate ratios
         left_ear = self.calculate_eye_aspect_ratio(left_eye)
@@ -157,28 +231,28 @@ class DrowsinessDetector:
         # EYE CLOSURE DETECTION (FIXED)
         # ============================================================
         eyes_closed = False
-        current_eye_state = "CLOSED" if avg_ear < Config.EAR_THRESHOLD else "OPEN"
+        current_eye_state = "CLOSED" if avg_ear < self._ear_threshold else "OPEN"
         
         # Detect BLINKS vs PROLONGED CLOSURE
         if current_eye_state == "CLOSED":
             self.eye_closure_counter += 1
             
             # ONLY count as drowsiness if closed for LONG time
-            if self.eye_closure_counter >= Config.EAR_CONSEC_FRAMES:
+            if self.eye_closure_counter >= self._ear_consec_frames:
                 eyes_closed = True
                 self.is_drowsy = True
                 # Increase drowsiness score
                 self.drowsiness_score = min(
-                    Config.DROWSINESS_SCORE_MAX,
-                    self.drowsiness_score + Config.DROWSINESS_SCORE_INCREMENT_EYES
+                    self._score_max,
+                    self.drowsiness_score + self._score_increment_eyes
                 )
         else:
             # Eyes are OPEN
             # CRITICAL FIX: Only count closures that were PROLONGED, not blinks
-            if self.eye_closure_counter >= Config.EAR_CONSEC_FRAMES:
+            if self.eye_closure_counter >= self._ear_consec_frames:
                 # This was a PROLONGED closure (drowsiness event)
                 self.total_eye_closures += 1
-                log.warning(f"Prolonged eye closure detected! Total: {self.total_eye_closures}")
+                log.warning("Prolonged eye closure detected! Total: {}", self.total_eye_closures)
             
             # Reset counter
             self.eye_closure_counter = 0
@@ -197,24 +271,24 @@ class DrowsinessDetector:
         # 2. Eyes are OPEN (avg_ear > threshold)
         # 3. MAR is significantly above normal talking range
         
-        if mar > Config.MAR_THRESHOLD and avg_ear > Config.EAR_THRESHOLD:
+        if mar > self._mar_threshold and avg_ear > self._ear_threshold:
             # Mouth is wide open AND eyes are open
             self.yawn_counter += 1
             
-            if self.yawn_counter >= Config.MAR_CONSEC_FRAMES:
+            if self.yawn_counter >= self._mar_consec_frames:
                 yawning = True
                 self.is_yawning = True
                 # Increase drowsiness score
                 self.drowsiness_score = min(
-                    Config.DROWSINESS_SCORE_MAX,
-                    self.drowsiness_score + Config.DROWSINESS_SCORE_INCREMENT_YAWN
+                    self._score_max,
+                    self.drowsiness_score + self._score_increment_yawn
                 )
         else:
             # Mouth not wide open OR eyes closed
-            if self.yawn_counter >= Config.MAR_CONSEC_FRAMES:
+            if self.yawn_counter >= self._mar_consec_frames:
                 # This was a valid yawn
                 self.total_yawns += 1
-                log.warning(f"Yawn detected! Total: {self.total_yawns}")
+                log.warning("Yawn detected! Total: {}", self.total_yawns)
             
             # Reset counter
             self.yawn_counter = 0
@@ -226,53 +300,47 @@ class DrowsinessDetector:
         # CRITICAL: Decay score when user is alert
         if not eyes_closed and not yawning:
             # User is alert - decrease score RAPIDLY
-            self.drowsiness_score = max(0, self.drowsiness_score - Config.DROWSINESS_SCORE_DECAY)
+            self.drowsiness_score = max(0, self.drowsiness_score - self._score_decay)
         
         # ============================================================
         # DETERMINE ALERT LEVEL
         # ============================================================
-        if self.drowsiness_score >= Config.ALERT_LEVEL_DANGER:
-            self.alert_level = "DANGER"
-        elif self.drowsiness_score >= Config.ALERT_LEVEL_WARNING:
-            self.alert_level = "WARNING"
-        else:
-            self.alert_level = "NORMAL"
-        
-        return {
-            'ear': avg_ear,
-            'mar': mar,
-            'eyes_closed': eyes_closed,
-            'yawning': yawning,
-            'drowsiness_score': self.drowsiness_score,
-            'alert_level': self.alert_level,
-            'eye_closure_counter': self.eye_closure_counter,
-            'yawn_counter': self.yawn_counter,
-            'total_eye_closures': self.total_eye_closures,
-            'total_yawns': self.total_yawns,
-            'left_eye_landmarks': left_eye,
-            'right_eye_landmarks': right_eye,
-            'mouth_landmarks': mouth,
-            'face_detected': self.face_detected
-        }
+        # The score sits at 0 or the maximum most of the time; only
+        # re-derive the level when it moved
+        if self.drowsiness_score != self._alert_level_score:
+            self._alert_level_score = self.drowsiness_score
+            if self.drowsiness_score >= self._alert_level_danger:
+                self.alert_level = "DANGER"
+            elif self.drowsiness_score >= self._alert_level_warning:
+                self.alert_level = "WARNING"
+            else:
+                self.alert_level = "NORMAL"
+        
+        result = self._result
+        result['ear'] = avg_ear
+        result['mar'] = mar
+        result['eyes_closed'] = eyes_closed
+        result['yawning'] = yawning
+        result['drowsiness_score'] = self.drowsiness_score
+        result['alert_level'] = self.alert_level
+        result['eye_closure_counter'] = self.eye_closure_counter
+        result['yawn_counter'] = self.yawn_counter
+        result['total_eye_closures'] = self.total_eye_closures
+        result['total_yawns'] = self.total_yawns
+        result['left_eye_landmarks'] = left_eye
+        result['right_eye_landmarks'] = right_eye
+        result['mouth_landmarks'] = mouth_outline
+        result['face_detected'] = self.face_detected
+        return result
     
     def _get_default_result(self):
         """Return default result when no face detected."""
-        return {
-            'ear': 0.0,
-            'mar': 0.0,
-            'eyes_closed': False,
-            'yawning': False,
-            'drowsiness_score': self.drowsiness_score,
-            'alert_level': self.alert_level,
-            'eye_closure_counter': 0,
-            'yawn_counter': 0,
-            'total_eye_closures': self.total_eye_closures,
-            'total_yawns': self.total_yawns,
-            'left_eye_landmarks': [],
-            'right_eye_landmarks': [],
-            'mouth_landmarks': [],
-            'face_detected': False
-        }
+        result = self._default_result
+        result['drowsiness_score'] = self.drowsiness_score
+        result['alert_level'] = self.alert_level
+        result['total_eye_closures'] = self.total_eye_closures
+        result['total_yawns'] = self.total_yawns
+        return result
     
     def reset(self):
         """Reset all counters and scores."""
@@ -282,6 +350,7 @@ class DrowsinessDetector:
         self.is_drowsy = False
         self.is_yawning = False
         self.alert_level = "NORMAL"
+        self._alert_level_score = None
         self.total_eye_closures = 0
         self.total_yawns = 0
         self.face_detected = False
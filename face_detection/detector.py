@@ -6,7 +6,6 @@ Note: This detector is for FACE detection only.
 Hand detection is handled separately in the main app using MediaPipe Hands.
 """
 
-import cv2
 import numpy as np
 import mediapipe as mp
 from config.settings import Config
@@ -16,6 +15,9 @@ from utils.logger import log
 class FaceDetector:
     """Face detection and landmark tracking using MediaPipe."""
     
+    # Minimum frames between repeated detection error logs
+    ERROR_LOG_INTERVAL = 60
+    
     def __init__(self):
         """Initialize face detector."""
         self.mp_face_mesh = mp.solutions.face_mesh
@@ -25,6 +27,13 @@ class FaceDetector:
         self.face_mesh = None
         self.is_initialized = False
         
+        # Set at initialize(): the single-driver setup takes a shortcut
+        self._single_face = False
+        
+        # Frame counter used to rate-limit error logging
+        self._frame_count = 0
+        self._last_error_frame = -self.ERROR_LOG_INTERVAL
+        
     def initialize(self):
         """
         Initialize MediaPipe FaceMesh model.
@@ -49,6 +58,7 @@ class FaceDetector:
                 min_tracking_confidence=Config.TRACKING_CONFIDENCE
             )
             
+            self._single_face = Config.MAX_NUM_FACES == 1
             self.is_initialized = True
             log.info("Face detector initialized successfully")
             log.info(f"Max faces: {Config.MAX_NUM_FACES}, Detection confidence: {Config.DETECTION_CONFIDENCE}")
@@ -64,7 +74,8 @@ class FaceDetector:
         Detect faces in a frame.
         
         Args:
-            frame (np.ndarray): Input frame (BGR format)
+            frame (np.ndarray): Input frame (RGB format, as returned by
+                VideoCapture.read_frame)
         
         Returns:
             list: List of detected faces with landmarks
@@ -73,26 +84,38 @@ class FaceDetector:
             log.warning("Detector not initialized")
             return []
         
+        self._frame_count += 1
+        
         try:
-            # Convert BGR to RGB (MediaPipe expects RGB)
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Process frame (already RGB, as MediaPipe expects)
+            results = self.face_mesh.process(frame)
+            
+            multi_face_landmarks = results.multi_face_landmarks
+            if not multi_face_landmarks:
+                return []
             
-            # Process frame
-            results = self.face_mesh.process(rgb_frame)
+            # FaceMesh returns at most one face when configured for one
+            if self._single_face:
+                return [{
+                    'landmarks': multi_face_landmarks[0],
+                    'frame_shape': frame.shape
+                }]
             
             # Extract face data
             faces = []
-            if results.multi_face_landmarks:
-                for face_landmarks in results.multi_face_landmarks:
-                    faces.append({
-                        'landmarks': face_landmarks,
-                        'frame_shape': frame.shape
-                    })
+            for face_landmarks in multi_face_landmarks:
+                faces.append({
+                    'landmarks': face_landmarks,
+                    'frame_shape': frame.shape
+                })
             
             return faces
             
         except Exception as e:
-            log.error(f"Error during face detection: {e}")
+            # A failing graph fails on every frame; log it once per interval
+            if self._frame_count - self._last_error_frame >= self.ERROR_LOG_INTERVAL:
+                self._last_error_frame = self._frame_count
+                log.error(f"Error during face detection: {e}")
             return []
     
     def get_face_info(self, face, frame_width, frame_height):
@@ -105,27 +128,28 @@ class FaceDetector:
             frame_height (int): Frame height
         
         Returns:
-            dict: Face information (bbox, landmarks, confidence)
+            dict: Face information (bbox, landmarks, confidence); bbox is a
+                tuple of Python ints, landmarks an (N, 2) int32 array of
+                pixel coordinates
         """
-        landmarks = face['landmarks']
-        
-        # Convert normalized landmarks to pixel coordinates
-        landmark_points = []
-        x_coords = []
-        y_coords = []
+        landmarks = face['landmarks'].landmark
         
-        for landmark in landmarks.landmark:
-            x = int(landmark.x * frame_width)
-            y = int(landmark.y * frame_height)
-            landmark_points.append((x, y))
-            x_coords.append(x)
-            y_coords.append(y)
+        # Convert normalized landmarks to an (N, 2) array of pixel coordinates
+        num_points = len(landmarks)
+        normalized = np.fromiter(
+            (value for landmark in landmarks for value in (landmark.x, landmark.y)),
+            dtype=np.float64,
+            count=2 * num_points
+        ).reshape(num_points, 2)
+        landmark_points = (normalized * (frame_width, frame_height)).astype(np.int32)
         
         # Calculate bounding box from landmarks
-        x_min = max(0, min(x_coords) - 10)
-        y_min = max(0, min(y_coords) - 10)
-        x_max = min(frame_width, max(x_coords) + 10)
-        y_max = min(frame_height, max(y_coords) + 10)
+        x_min_lm, y_min_lm = landmark_points.min(axis=0)
+        x_max_lm, y_max_lm = landmark_points.max(axis=0)
+        x_min = max(0, int(x_min_lm) - 10)
+        y_min = max(0, int(y_min_lm) - 10)
+        x_max = min(frame_width, int(x_max_lm) + 10)
+        y_max = min(frame_height, int(y_max_lm) + 10)
         
         bbox = (x_min, y_min, x_max, y_max)
         
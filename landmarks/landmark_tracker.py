@@ -28,27 +28,44 @@ class LandmarkTracker:
             'mouth': [61, 291, 0, 17],
             'face_oval': list(range(0, 17))
         }
+        
+        # The same indices as arrays, for one NumPy gather per feature
+        self._key_landmark_idx = {
+            name: np.array(indices, dtype=np.intp)
+            for name, indices in self.key_landmark_indices.items()
+        }
+        self._max_key_index = max(
+            max(indices) for indices in self.key_landmark_indices.values()
+        )
     
     def process_landmarks(self, landmarks):
         """
         Process raw landmarks.
         
         Args:
-            landmarks (list): List of landmark tuples [(x, y), ...]
+            landmarks (np.ndarray): (N, 2) landmarks
         
         Returns:
-            dict: Processed landmark data
+            dict: Processed landmark data; key landmarks are (K, 2) arrays
         """
         if landmarks is None or len(landmarks) == 0:
             return None
         
         # Extract key landmarks for easier access
-        key_landmarks = {}
-        
-        for name, indices in self.key_landmark_indices.items():
-            key_landmarks[name] = [
-                landmarks[idx] for idx in indices if idx < len(landmarks)
-            ]
+        points = np.asarray(landmarks)
+        num_points = len(points)
+        
+        if num_points > self._max_key_index:
+            key_landmarks = {
+                name: points[indices]
+                for name, indices in self._key_landmark_idx.items()
+            }
+        else:
+            # Partial landmark set: keep only the indices that exist
+            key_landmarks = {
+                name: points[indices[indices < num_points]]
+                for name, indices in self._key_landmark_idx.items()
+            }
         
         return {
             'all_landmarks': landmarks,
@@ -61,20 +78,21 @@ class LandmarkTracker:
         Scale landmarks from processed frame to original frame size.
         
         Args:
-            landmarks (list): Landmarks in processed frame coordinates
+            landmarks (np.ndarray): (..., 2) landmarks in processed frame
+                coordinates, e.g. (N, 2) face or (H, 21, 2) hand landmarks
             scale_x (float): X scaling factor
             scale_y (float): Y scaling factor
         
         Returns:
-            list: Scaled landmarks
+            np.ndarray: int32 scaled landmarks of the same shape
         """
         if landmarks is None or len(landmarks) == 0:
             return None
         
-        scaled_landmarks = [
-            (int(x * scale_x), int(y * scale_y))
-            for x, y in landmarks
-        ]
+        # Multiply straight into the int32 result (truncating, as int() did)
+        landmarks = np.asarray(landmarks)
+        scaled_landmarks = np.empty(landmarks.shape, dtype=np.int32)
+        np.multiply(landmarks, (scale_x, scale_y), out=scaled_landmarks, casting='unsafe')
         
         return scaled_landmarks
     
@@ -91,18 +109,15 @@ class LandmarkTracker:
         if landmarks is None or len(landmarks) == 0:
             return None
         
-        # Convert to numpy array for easier calculations
-        points = np.array(landmarks)
+        # Convert to numpy array for easier calculations (no copy for arrays)
+        points = np.asarray(landmarks)
         
         # Calculate face center (average of all landmarks)
-        center_x = np.mean(points[:, 0])
-        center_y = np.mean(points[:, 1])
+        center_x, center_y = points.mean(axis=0)
         
-        # Calculate face bounds
-        min_x = np.min(points[:, 0])
-        max_x = np.max(points[:, 0])
-        min_y = np.min(points[:, 1])
-        max_y = np.max(points[:, 1])
+        # Calculate face bounds, one reduction per direction over both axes
+        min_x, min_y = points.min(axis=0)
+        max_x, max_y = points.max(axis=0)
         
         face_width = max_x - min_x
         face_height = max_y - min_y
@@ -121,11 +136,11 @@ class LandmarkTracker:
         Returns every Nth landmark for cleaner visualization.
         
         Args:
-            landmarks (list): All landmarks
+            landmarks (np.ndarray): All landmarks
             step (int): Take every Nth landmark
         
         Returns:
-            list: Filtered landmarks
+            np.ndarray: Filtered landmarks (a strided view, not a copy)
         """
         if landmarks is None or len(landmarks) == 0:
             return []
@@ -4,7 +4,6 @@ Detects ACTUAL phone usage by requiring hand to be very close to face/ear.
 """
 
 import numpy as np
-from scipy.spatial import distance
 from config.settings import Config
 from utils.logger import log
 
@@ -36,46 +35,88 @@ class PhoneDetector:
         self.current_phone_duration = 0  # Frames
         self.longest_phone_duration = 0  # Frames
         
+        # Result dict, reused every frame and updated in place; the last
+        # three fields are constant
+        self._result = {
+            'phone_detected': False,
+            'confidence': 0.0,
+            'detection_reasons': [],
+            'phone_detection_counter': 0,
+            'total_phone_detections': 0,
+            'current_duration': 0,
+            'longest_duration': 0,
+            'phone_bbox': None,  # Always None now
+            'head_tilted': False,
+            'tilt_angle': 0.0
+        }
+        
         log.info("Phone detector initialized")
 
+    @staticmethod
+    def _face_geometry(face_bbox):
+        """
+        Derive the face measurements the hand checks use.
+        
+        Computed once per frame and shared by every hand.
+        
+        Args:
+            face_bbox (tuple): Face bounding box (x1, y1, x2, y2)
+        
+        Returns:
+            tuple: (face_x1, face_y1, face_x2, face_y2, face_size,
+                face_center_y, vertical_tolerance), or None without a face
+        """
+        if not face_bbox:
+            return None
+        
+        face_x1, face_y1, face_x2, face_y2 = face_bbox
+        face_width = face_x2 - face_x1
+        face_height = face_y2 - face_y1
+        
+        face_size = max(face_width, face_height)
+        face_center_y = (face_y1 + face_y2) / 2
+        
+        # Allow ±30% of face height tolerance around ear level
+        vertical_tolerance = face_height * 0.3
+        
+        return (face_x1, face_y1, face_x2, face_y2, face_size, face_center_y, vertical_tolerance)
+
     def calculate_hand_to_face_distance(self, hand_landmarks, face_bbox):
         """
         Calculate precise distance from hand to face.
         
         Args:
-            hand_landmarks (list): Hand landmarks
+            hand_landmarks (np.ndarray): (21, 2) hand landmarks
             face_bbox (tuple): Face bounding box
         
         Returns:
             float: Distance ratio (0.0 = touching face, higher = farther)
         """
-        if not hand_landmarks or not face_bbox:
+        if hand_landmarks is None or len(hand_landmarks) == 0 or not face_bbox:
             return 999.0
         
-        # Get face dimensions
-        face_x1, face_y1, face_x2, face_y2 = face_bbox
-        face_width = face_x2 - face_x1
-        face_height = face_y2 - face_y1
+        return self._hand_to_face_distance(np.asarray(hand_landmarks), self._face_geometry(face_bbox))
+
+    def _hand_to_face_distance(self, points, face_geometry):
+        """
+        Distance ratio of calculate_hand_to_face_distance.
         
-        # Find closest point on hand to face
-        min_dist = 999999
-        for landmark in hand_landmarks:
-            x, y = landmark
-            
-            # Distance to face edges
-            dist_to_left = abs(x - face_x1)
-            dist_to_right = abs(x - face_x2)
-            dist_to_top = abs(y - face_y1)
-            dist_to_bottom = abs(y - face_y2)
-            
-            # Minimum distance to any face edge
-            dist = min(dist_to_left, dist_to_right, dist_to_top, dist_to_bottom)
-            
-            if dist < min_dist:
-                min_dist = dist
+        Args:
+            points (np.ndarray): (21, 2) hand landmarks
+            face_geometry (tuple): Result of _face_geometry
+        
+        Returns:
+            float: Distance ratio
+        """
+        face_x1, face_y1, face_x2, face_y2, face_size = face_geometry[:5]
+        
+        # Find closest point on hand to face: the smallest distance from any
+        # landmark to any face edge, over all landmarks at once
+        dist_x = np.abs(points[:, 0, None] - (face_x1, face_x2)).min()
+        dist_y = np.abs(points[:, 1, None] - (face_y1, face_y2)).min()
+        min_dist = min(dist_x, dist_y).item()
         
         # Normalize by face size
-        face_size = max(face_width, face_height)
         distance_ratio = min_dist / face_size if face_size > 0 else 999.0
         
         return distance_ratio
@@ -85,25 +126,34 @@ class PhoneDetector:
         Check if hand is at typical phone-to-ear position.
         
         Args:
-            hand_landmarks (list): Hand landmarks
+            hand_landmarks (np.ndarray): (21, 2) hand landmarks
             face_bbox (tuple): Face bounding box
         
         Returns:
             bool: True if hand is at ear position
         """
-        if not hand_landmarks or not face_bbox:
+        if hand_landmarks is None or len(hand_landmarks) == 0 or not face_bbox:
             return False
         
-        face_x1, face_y1, face_x2, face_y2 = face_bbox
-        face_center_y = (face_y1 + face_y2) / 2
+        return self._at_ear_position(np.asarray(hand_landmarks), self._face_geometry(face_bbox))
+
+    def _at_ear_position(self, points, face_geometry):
+        """
+        Ear-position test of is_hand_at_ear_position.
+        
+        Args:
+            points (np.ndarray): (21, 2) hand landmarks
+            face_geometry (tuple): Result of _face_geometry
+        
+        Returns:
+            bool: True if hand is at ear position
+        """
+        face_x1, _, face_x2, _, _, face_center_y, vertical_tolerance = face_geometry
         
-        # Get hand center
-        hand_x = np.mean([p[0] for p in hand_landmarks])
-        hand_y = np.mean([p[1] for p in hand_landmarks])
+        # Get hand center, both axes in one reduction
+        hand_x, hand_y = points.mean(axis=0).tolist()
         
         # Check if hand is at ear level (same height as face center)
-        # Allow ±30% of face height tolerance
-        vertical_tolerance = (face_y2 - face_y1) * 0.3
         is_at_ear_height = abs(hand_y - face_center_y) < vertical_tolerance
         
         # Check if hand is beside face (not in front)
@@ -120,7 +170,7 @@ class PhoneDetector:
         detection_reasons = []
         
         # No hands detected = reset session
-        if hands_detected == 0 or not hand_landmarks_list:
+        if hands_detected == 0 or len(hand_landmarks_list) == 0:
             self.phone_detection_counter = 0
             self.current_phone_duration = 0
             self.phone_detected = False
@@ -128,26 +178,34 @@ class PhoneDetector:
         
         best_confidence = 0.0
         
+        # Face measurements are shared by every hand
+        face_geometry = self._face_geometry(face_bbox)
+        
         for hand_landmarks in hand_landmarks_list:
-            if not hand_landmarks:
+            if len(hand_landmarks) == 0 or face_geometry is None:
                 continue
             
             hand_confidence = 0.0
+            points = np.asarray(hand_landmarks)
             
             # CRITICAL CHECK 1: Hand proximity to face
-            distance_ratio = self.calculate_hand_to_face_distance(hand_landmarks, face_bbox)
+            distance_ratio = self._hand_to_face_distance(points, face_geometry)
             
             if distance_ratio < 0.3:
                 hand_confidence += 0.6
                 detection_reasons.append(f"Hand very close (dist: {distance_ratio:.2f})")
             
             # CRITICAL CHECK 2: Vertical alignment with ear
-            if self.is_hand_at_ear_position(hand_landmarks, face_bbox):
+            if self._at_ear_position(points, face_geometry):
                 hand_confidence += 0.4
                 detection_reasons.append("Hand at ear position")
             
             if hand_confidence > best_confidence:
                 best_confidence = hand_confidence
+                
+                # Both checks passed; no other hand can score higher
+                if best_confidence >= 1.0:
+                    break
         
         confidence = best_confidence
         
@@ -169,8 +227,8 @@ class PhoneDetector:
             if self.phone_detection_counter >= Config.PHONE_CONSEC_FRAMES:
                 self.total_phone_detections += 1
                 duration_seconds = self.current_phone_duration / 30.0  # assuming ~30 fps
-                log.warning(f"Phone usage ended! Total uses: {self.total_phone_detections}, "
-                            f"Duration: {duration_seconds:.1f} seconds")
+                log.warning("Phone usage ended! Total uses: {}, Duration: {:.1f} seconds",
+                            self.total_phone_detections, duration_seconds)
             
             self.phone_detection_counter = 0
             self.phone_detected = False
@@ -180,18 +238,15 @@ class PhoneDetector:
 
     def _get_result(self, detected, confidence, reasons, face_landmarks):
         """Format detection result."""
-        return {
-            'phone_detected': detected,
-            'confidence': confidence,
-            'detection_reasons': reasons,
-            'phone_detection_counter': self.phone_detection_counter,
-            'total_phone_detections': self.total_phone_detections,
-            'current_duration': self.current_phone_duration,
-            'longest_duration': self.longest_phone_duration,
-            'phone_bbox': None,  # Always None now
-            'head_tilted': False,
-            'tilt_angle': 0.0
-        }
+        result = self._result
+        result['phone_detected'] = detected
+        result['confidence'] = confidence
+        result['detection_reasons'] = reasons
+        result['phone_detection_counter'] = self.phone_detection_counter
+        result['total_phone_detections'] = self.total_phone_detections
+        result['current_duration'] = self.current_phone_duration
+        result['longest_duration'] = self.longest_phone_duration
+        return result
 
     def reset(self):
         """Full reset of the detector."""
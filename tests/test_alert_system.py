@@ -0,0 +1,67 @@
+"""
+Regression checks for the cached alert overlay sprites.
+"""
+
+import cv2
+import numpy as np
+import pytest
+
+from config.settings import Config
+from alerts.alert_system import AlertSystem
+
+
+def _draw_status_reference(frame, face_detected, eyes_closed, yawning, ear, mar):
+    """Status indicators drawn directly with cv2.putText, as before sprites."""
+    x = frame.shape[1] - 220
+    y = 80
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    
+    if not face_detected:
+        cv2.putText(frame, "No Face Detected", (x, y), font, 0.5, (0, 0, 255), 2)
+        return
+    
+    eye_status = "CLOSED" if eyes_closed else "OPEN"
+    eye_color = Config.COLOR_DANGER if eyes_closed else Config.COLOR_NORMAL
+    cv2.putText(frame, f"Eyes: {eye_status}", (x, y), font, 0.5, eye_color, 2)
+    
+    yawn_status = "YAWNING" if yawning else "NORMAL"
+    yawn_color = Config.COLOR_WARNING if yawning else Config.COLOR_NORMAL
+    cv2.putText(frame, f"Mouth: {yawn_status}", (x, y + 25), font, 0.5, yawn_color, 2)
+    
+    cv2.putText(frame, f"EAR: {ear:.3f}", (x, y + 50), font, 0.4, (255, 255, 255), 1)
+    cv2.putText(frame, f"MAR: {mar:.3f}", (x, y + 70), font, 0.4, (255, 255, 255), 1)
+
+
+@pytest.fixture(scope="module")
+def alert_system():
+    enabled = Config.ENABLE_AUDIO_ALERTS
+    Config.ENABLE_AUDIO_ALERTS = False
+    try:
+        yield AlertSystem()
+    finally:
+        Config.ENABLE_AUDIO_ALERTS = enabled
+
+
+@pytest.mark.parametrize("shape", [
+    (480, 640),
+    (480, 222),
+    (480, 200),  # Panel starts left of the frame
+    (240, 120),
+    (130, 640),  # Panel runs past the bottom of the frame
+    (40, 60),
+])
+@pytest.mark.parametrize("status", [
+    (True, False, False, 0.312, 0.204),
+    (True, True, True, 0.151, 0.733),
+    (False, False, False, 0.0, 0.0),
+])
+def test_status_panel_matches_put_text(alert_system, shape, status):
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (*shape, 3), dtype=np.uint8)
+    expected = frame.copy()
+    
+    alert_system._precompute_layout(*shape)
+    alert_system._draw_status_indicators(frame, *status)
+    _draw_status_reference(expected, *status)
+    
+    np.testing.assert_array_equal(frame, expected)
@@ -3,7 +3,6 @@ FPS (Frames Per Second) counter for performance monitoring.
 """
 
 import time
-from collections import deque
 
 
 class FPSCounter:
@@ -17,14 +16,22 @@ class FPSCounter:
             window_size (int): Number of frames to average over
         """
         self.window_size = window_size
-        self.frame_times = deque(maxlen=window_size)
-        self.start_time = time.time()
+        
+        # Ring buffer of the last window_size frame timestamps; _head is the
+        # slot the next timestamp goes into, i.e. the oldest one once full
+        self._timestamps = [0.0] * window_size
+        self._head = 0
+        self._count = 0
+        
+        self.start_time = time.perf_counter()
         self.frame_count = 0
     
     def update(self):
         """Update FPS calculation with new frame."""
-        current_time = time.time()
-        self.frame_times.append(current_time)
+        self._timestamps[self._head] = time.perf_counter()
+        self._head = (self._head + 1) % self.window_size
+        if self._count < self.window_size:
+            self._count += 1
         self.frame_count += 1
     
     def get_fps(self):
@@ -34,18 +41,23 @@ class FPSCounter:
         Returns:
             float: Current FPS value
         """
-        if len(self.frame_times) < 2:
+        count = self._count
+        if count < 2:
             return 0.0
         
         # Calculate FPS based on time window
-        time_diff = self.frame_times[-1] - self.frame_times[0]
+        head = self._head
+        newest = self._timestamps[head - 1]
+        oldest = self._timestamps[head - count]
+        time_diff = newest - oldest
         if time_diff > 0:
-            fps = (len(self.frame_times) - 1) / time_diff
+            fps = (count - 1) / time_diff
             return fps
         return 0.0
     
     def reset(self):
         """Reset FPS counter."""
-        self.frame_times.clear()
-        self.start_time = time.time()
+        self._head = 0
+        self._count = 0
+        self.start_time = time.perf_counter()
         self.frame_count = 0
\ No newline at end of file
@@ -17,16 +17,21 @@ def setup_logger():
     # Remove default handler
     logger.remove()
     
-    # Add custom handler with formatting
+    # Add custom handler with formatting. Records are queued and written by
+    # loguru's worker thread, so console I/O never stalls frame processing.
     logger.add(
         sys.stdout,
         format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
         level=Config.LOG_LEVEL,
-        colorize=True
+        colorize=True,
+        enqueue=True
     )
     
     return logger
 
 
-# Create global logger instance
+# Create global logger instance. Calls below Config.LOG_LEVEL return before a
+# record is built, so only the formatting is left to avoid: code that runs
+# per frame passes values as "{}" arguments rather than f-strings, and wraps
+# costly ones with log.opt(lazy=True) and a lambda.
 log = setup_logger()
\ No newline at end of file
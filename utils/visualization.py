@@ -3,24 +3,114 @@ Visualization utilities for drawing bounding boxes and landmarks.
 Includes drowsiness and phone detection visualizations.
 """
 
+from functools import lru_cache
 import cv2
 import numpy as np
 from config.settings import Config
 
 
+# Below this many points a cv2.circle per point is cheaper than building
+# the stamp indices
+_MIN_STAMP_POINTS = 16
+
+
+@lru_cache(maxsize=None)
+def _disc_offsets(radius, width):
+    """
+    Flat pixel offsets covered by a filled cv2.circle of the given radius.
+    
+    Args:
+        radius (int): Circle radius in pixels
+        width (int): Width of the frame the offsets index into
+    
+    Returns:
+        np.ndarray: Offsets from the circle center in a flattened frame
+    """
+    size = 2 * radius + 1
+    stamp = np.zeros((size, size), dtype=np.uint8)
+    cv2.circle(stamp, (radius, radius), radius, 255, -1)
+    dy, dx = np.nonzero(stamp)
+    return (dy - radius) * width + (dx - radius)
+
+
+def draw_points(frame, points, radius, color):
+    """
+    Draw filled circles at many points with a single indexed write.
+    
+    Stamps the pixels cv2.circle would fill, without a Python-level
+    cv2.circle call per point. Points whose circle crosses the frame
+    edge, and small point sets, are drawn with cv2.circle.
+    
+    Args:
+        frame (np.ndarray): Input frame (C-contiguous)
+        points (np.ndarray): (N, 2) integer point coordinates (x, y)
+        radius (int): Circle radius in pixels
+        color (tuple): BGR color
+    
+    Returns:
+        np.ndarray: Frame with points drawn
+    """
+    points = np.asarray(points)
+    if len(points) == 0:
+        return frame
+    
+    if len(points) < _MIN_STAMP_POINTS:
+        for x, y in points.tolist():
+            cv2.circle(frame, (int(x), int(y)), radius, color, -1)
+        return frame
+    
+    h, w = frame.shape[:2]
+    x = points[:, 0]
+    y = points[:, 1]
+    inside = (x >= radius) & (x < w - radius) & (y >= radius) & (y < h - radius)
+    
+    # A flattened view needs a contiguous frame; otherwise draw point by point
+    if not frame.flags['C_CONTIGUOUS']:
+        inside[:] = False
+    
+    # Interior points: one fancy-indexed write into the flattened frame
+    centers = y[inside] * w + x[inside]
+    flat = frame.reshape(-1, frame.shape[2])
+    flat[(centers[:, None] + _disc_offsets(radius, w)).ravel()] = color
+    
+    # Edge points (rare): cv2.circle clips them
+    if not inside.all():
+        for point in points[~inside]:
+            cv2.circle(frame, (int(point[0]), int(point[1])), radius, color, -1)
+    
+    return frame
+
+
+@lru_cache(maxsize=128)
+def _text_size(text, font, scale, thickness):
+    """
+    Memoized cv2.getTextSize for labels that repeat from frame to frame.
+    
+    Args:
+        text (str): Text to measure
+        font (int): OpenCV font face
+        scale (float): Font scale
+        thickness (int): Stroke thickness
+    
+    Returns:
+        tuple: (width, height) of the text
+    """
+    return cv2.getTextSize(text, font, scale, thickness)[0]
+
+
 def draw_bounding_box(frame, bbox, confidence=None):
     """
     Draw bounding box around detected face.
     
     Args:
         frame (np.ndarray): Input frame
-        bbox (tuple): Bounding box coordinates (x1, y1, x2, y2)
+        bbox (tuple): Integer bounding box coordinates (x1, y1, x2, y2)
         confidence (float, optional): Detection confidence score
     
     Returns:
         np.ndarray: Frame with bounding box drawn
     """
-    x1, y1, x2, y2 = map(int, bbox)
+    x1, y1, x2, y2 = bbox
     
     # Draw rectangle
     cv2.rectangle(
@@ -34,12 +124,7 @@ def draw_bounding_box(frame, bbox, confidence=None):
     # Draw confidence score if provided
     if confidence is not None:
         label = f"Conf: {confidence:.2f}"
-        label_size, _ = cv2.getTextSize(
-            label,
-            Config.FPS_FONT,
-            0.5,
-            1
-        )
+        label_size = _text_size(label, Config.FPS_FONT, 0.5, 1)
         
         # Background for text
         cv2.rectangle(
@@ -79,6 +164,11 @@ def draw_landmarks(frame, landmarks, connections=None):
     if landmarks is None or len(landmarks) == 0:
         return frame
     
+    # Filled points are stamped in one call; outlined ones need cv2.circle
+    if Config.LANDMARK_THICKNESS < 0:
+        draw_points(frame, landmarks, Config.LANDMARK_RADIUS, Config.LANDMARK_COLOR)
+        return frame
+    
     # Draw each landmark point
     for point in landmarks:
         cv2.circle(
@@ -98,8 +188,8 @@ def draw_eye_landmarks(frame, left_eye, right_eye, eyes_closed=False):
     
     Args:
         frame (np.ndarray): Input frame
-        left_eye (list): Left eye landmarks
-        right_eye (list): Right eye landmarks
+        left_eye (np.ndarray): (N, 2) left eye landmarks
+        right_eye (np.ndarray): (N, 2) right eye landmarks
         eyes_closed (bool): Whether eyes are closed
     
     Returns:
@@ -107,18 +197,18 @@ def draw_eye_landmarks(frame, left_eye, right_eye, eyes_closed=False):
     """
     color = Config.COLOR_DANGER if eyes_closed else Config.EYE_COLOR
     
-    # Draw left eye
-    if left_eye and len(left_eye) >= 6:
-        points = np.array(left_eye, dtype=np.int32)
-        cv2.polylines(frame, [points], True, color, Config.EYE_THICKNESS)
-        for point in left_eye:
-            cv2.circle(frame, point, 2, color, -1)
+    eyes = [
+        np.asarray(eye, dtype=np.int32)
+        for eye in (left_eye, right_eye)
+        if eye is not None and len(eye) >= 6
+    ]
+    if not eyes:
+        return frame
     
-    # Draw right eye
-    if right_eye and len(right_eye) >= 6:
-        points = np.array(right_eye, dtype=np.int32)
-        cv2.polylines(frame, [points], True, color, Config.EYE_THICKNESS)
-        for point in right_eye:
+    # Both contours in one call, then the vertex dots
+    cv2.polylines(frame, eyes, True, color, Config.EYE_THICKNESS)
+    for points in eyes:
+        for point in points.tolist():
             cv2.circle(frame, point, 2, color, -1)
     
     return frame
@@ -130,32 +220,98 @@ def draw_mouth_landmarks(frame, mouth_landmarks, yawning=False):
     
     Args:
         frame (np.ndarray): Input frame
-        mouth_landmarks (list): Mouth landmarks
+        mouth_landmarks (np.ndarray): (N, 2) mouth landmarks
         yawning (bool): Whether person is yawning
     
     Returns:
         np.ndarray: Frame with mouth landmarks drawn
     """
-    if not mouth_landmarks or len(mouth_landmarks) < 8:
+    if mouth_landmarks is None or len(mouth_landmarks) < 8:
         return frame
     
     color = Config.COLOR_WARNING if yawning else Config.MOUTH_COLOR
     
     # Draw mouth contour
-    points = np.array(mouth_landmarks, dtype=np.int32)
+    points = np.asarray(mouth_landmarks, dtype=np.int32)
     cv2.polylines(frame, [points], True, color, Config.MOUTH_THICKNESS)
     
-    # Draw landmarks
-    for point in mouth_landmarks:
+    # Draw landmarks; plain lists are cheaper for cv2 to parse than array rows
+    for point in points.tolist():
         cv2.circle(frame, point, 2, color, -1)
     
     return frame
 
 
+@lru_cache(maxsize=256)
+def _text_pixels(text, position, font, scale, thickness, frame_width, frame_height):
+    """
+    Rasterise text once and return the frame pixels its glyphs cover.
+    
+    Args:
+        text (str): Text to render
+        position (tuple): Baseline origin (x, y) in frame coordinates
+        font (int): OpenCV font face
+        scale (float): Font scale
+        thickness (int): Stroke thickness
+        frame_width (int): Width of the target frame
+        frame_height (int): Height of the target frame
+    
+    Returns:
+        np.ndarray: Indices of the glyph pixels in the flattened frame
+    """
+    (text_w, text_h), baseline = cv2.getTextSize(text, font, scale, thickness)
+    pad = thickness + 2
+    
+    x0 = position[0] - pad
+    y0 = position[1] - text_h - pad
+    mask_h = text_h + baseline + 2 * pad
+    mask_w = text_w + 2 * pad
+    
+    # Text running off the frame is clipped by putText itself, which can
+    # leave stray pixels on the border; render those at full frame size
+    if x0 < 0 or y0 < 0 or x0 + mask_w > frame_width or y0 + mask_h > frame_height:
+        mask = np.zeros((frame_height, frame_width), dtype=np.uint8)
+        cv2.putText(mask, text, position, font, scale, 255, thickness)
+        return np.flatnonzero(mask)
+    
+    # Render into a small mask around the text, not the whole frame
+    mask = np.zeros((mask_h, mask_w), dtype=np.uint8)
+    cv2.putText(mask, text, (pad, text_h + pad), font, scale, 255, thickness)
+    
+    ys, xs = np.nonzero(mask)
+    return (ys + y0) * frame_width + (xs + x0)
+
+
+def _put_text(frame, text, position, font, scale, color, thickness):
+    """
+    Draw text like cv2.putText, reusing the cached glyph pixels.
+    
+    Args:
+        frame (np.ndarray): Input frame
+        text (str): Text to render
+        position (tuple): Baseline origin (x, y)
+        font (int): OpenCV font face
+        scale (float): Font scale
+        color (tuple): BGR color
+        thickness (int): Stroke thickness
+    """
+    # A flattened view needs a contiguous frame
+    if not frame.flags['C_CONTIGUOUS']:
+        cv2.putText(frame, text, position, font, scale, color, thickness)
+        return
+    
+    h, w = frame.shape[:2]
+    pixels = _text_pixels(text, position, font, scale, thickness, w, h)
+    frame.reshape(-1, frame.shape[2])[pixels] = color
+
+
 def draw_fps(frame, fps_value):
     """
     Draw FPS counter on frame.
     
+    The text is rasterised once per distinct value; later frames only
+    write its cached pixels.
+    
     Args:
         frame (np.ndarray): Input frame
         fps_value (float): Current FPS
@@ -163,11 +319,9 @@ def draw_fps(frame, fps_value):
     Returns:
         np.ndarray: Frame with FPS displayed
     """
-    fps_text = f"FPS: {fps_value:.1f}"
-    
-    cv2.putText(
+    _put_text(
         frame,
-        fps_text,
+        f"FPS: {fps_value:.1f}",
         Config.FPS_POSITION,
         Config.FPS_FONT,
         Config.FPS_SCALE,
@@ -213,13 +367,19 @@ def draw_dashboard(frame, combined_data):
     # Draw semi-transparent background
     bg_height = len(stats) * spacing + 20
     bg_width = 250
-    overlay = frame.copy()
-    cv2.rectangle(overlay, (x - 5, y - 20), (x + bg_width, y + bg_height), (0, 0, 0), -1)
-    cv2.addWeighted(overlay, 0.3, frame, 0.7, 0, frame)
+    h, w = frame.shape[:2]
+    roi = frame[
+        max(y - 20, 0):min(y + bg_height + 1, h),
+        max(x - 5, 0):min(x + bg_width + 1, w)
+    ]
     
-    # Draw text
+    # Only the box is blended; the rest of the frame is left untouched
+    if roi.size:
+        cv2.addWeighted(np.zeros_like(roi), 0.3, roi, 0.7, 0, roi)
+    
+    # Draw text; each line is only rasterised again when its value changes
     for i, stat in enumerate(stats):
-        cv2.putText(
+        _put_text(
             frame,
             stat,
             (x, y + i * spacing),
@@ -245,12 +405,7 @@ def draw_no_face_message(frame):
     message = "No Face Detected"
     
     # Get text size for centering
-    text_size, _ = cv2.getTextSize(
-        message,
-        Config.FPS_FONT,
-        1.0,
-        2
-    )
+    text_size = _text_size(message, Config.FPS_FONT, 1.0, 2)
     
     # Calculate center position
     height, width = frame.shape[:2]
@@ -258,7 +413,7 @@ def draw_no_face_message(frame):
     y = (height + text_size[1]) // 2
     
     # Draw text
-    cv2.putText(
+    _put_text(
         frame,
         message,
         (x, y),